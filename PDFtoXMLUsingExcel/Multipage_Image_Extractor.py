@@ -1274,7 +1274,8 @@ def render_full_page_as_image(
     footer_margin_pct: float = 0.08,
     left_margin_pct: float = 0.05,
     right_margin_pct: float = 0.05,
-) -> None:
+    return_image: bool = False,
+) -> Optional["Image.Image"]:
     """
     Render an entire page as a single image.
 
@@ -1295,6 +1296,12 @@ def render_full_page_as_image(
         footer_margin_pct: Percentage of page height to exclude from bottom (default: 8%)
         left_margin_pct: Percentage of page width to exclude from left (default: 5%)
         right_margin_pct: Percentage of page width to exclude from right (default: 5%)
+        return_image: If True, return the render as a PIL image built straight from
+                      the pixmap samples instead of writing a PNG to media_dir
+                      (no media element or mapper entry is created)
+
+    Returns:
+        PIL image when return_image is True (and PIL is available), else None
     """
     page_rect = page.rect
 
@@ -1317,6 +1324,11 @@ def render_full_page_as_image(
     # Use high-quality rendering with clip to render only the content area
     # This crops out headers, footers, margins, and crop marks
     pix = page.get_pixmap(dpi=dpi, clip=content_rect)
+
+    if return_image and HAS_PIL:
+        # Skip the PNG encode/decode round-trip; alpha is off so samples are RGB
+        return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
     pix.save(out_path)
 
     # Register in reference mapper (use content_rect dimensions)
@@ -13,7 +13,10 @@ The script converts font-level formatting into appropriate inline elements:
 - Regular phrases → merged into plain text
 
 Usage:
-    python combine_phrases_in_para.py input.xml output.xml
+    python combine_phrases_in_para.py input.xml output.xml [--compact]
+
+    --compact skips pretty-printing and streams each combined para straight
+    to the output with a string writer instead of rebuilding the tree.
 """
 
 import sys
@@ -21,6 +24,7 @@ import re
 from pathlib import Path
 from typing import List, Tuple, Optional
 from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape
 from copy import deepcopy
 
 
@@ -40,13 +44,28 @@ def is_italic_font(font_name: str) -> bool:
     return any(keyword in font_lower for keyword in ['italic', 'oblique', 'slant'])
 
 
+# font name -> emphasis role, filled on first sight of each font
+_ROLE_CACHE: dict = {}
+_SENTINEL = object()
+
+
 def get_emphasis_role(font_name: str) -> Optional[str]:
     """
     Determine the emphasis role based on font name.
     
+    Fonts are classified once; later calls are a single dict lookup.
+    
     Returns:
         'bold', 'italic', 'bold-italic', or None for regular text
     """
+    role = _ROLE_CACHE.get(font_name, _SENTINEL)
+    if role is _SENTINEL:
+        role = _ROLE_CACHE[font_name] = _compute_role(font_name)
+    return role
+
+
+def _compute_role(font_name: str) -> Optional[str]:
+    """Classify a font name by keyword scan (uncached get_emphasis_role)."""
     if not font_name:
         return None
     
@@ -75,11 +94,75 @@ def normalize_attributes(attrs: dict) -> dict:
     return normalized
 
 
+_INLINE_TAGS = frozenset(('phrase', 'emphasis', 'subscript', 'superscript'))
+
+
+def _group_key(child: ET.Element) -> Optional[Tuple]:
+    """
+    Merge key (type, role, font, size, color) for an inline child.
+
+    Returns:
+        None if the child is not an inline element
+    """
+    tag = child.tag
+    if tag not in _INLINE_TAGS:
+        return None
+    
+    attrib = child.attrib
+    role = attrib.get('role')
+    if role is None:
+        role = get_emphasis_role(attrib.get('font', ''))
+    
+    # Determine the element type for this text
+    if tag == 'subscript' or tag == 'superscript':
+        # Keep subscript/superscript as-is
+        key = (tag, None)
+    elif role:
+        # Explicit emphasis role or phrase with font-based role
+        key = ('emphasis', role)
+    else:
+        # Regular text
+        key = ('text', None)
+    return key + (attrib.get('font'), attrib.get('size'), attrib.get('color'))
+
+
+def _emit_group(target_elem: ET.Element, prev_elem: Optional[ET.Element],
+                key: Tuple, parts: List[str]) -> Optional[ET.Element]:
+    """
+    Write one merged group into target_elem.
+
+    Plain text goes to target_elem.text (before any inline element) or to the
+    tail of the previous inline element; everything else becomes a SubElement.
+
+    Returns:
+        The last inline element written into target_elem (or None)
+    """
+    elem_type, elem_role = key[0], key[1]
+    text = ''.join(parts)
+
+    if elem_type == 'text':
+        if prev_elem is not None:
+            prev_elem.tail += text
+        else:
+            target_elem.text += text
+        return prev_elem
+
+    elem = ET.SubElement(target_elem, elem_type)
+    if elem_role:
+        elem.set('role', elem_role)
+    elem.text = text
+    elem.tail = ''
+    return elem
+
+
 def combine_phrases_in_para(para_elem: ET.Element) -> ET.Element:
     """
     Combine multiple phrase elements within a para into flowing text
     while preserving font formatting.
     
+    Consecutive inline children with the same (type, role, font, size, color)
+    key are merged in a single pass and flushed straight into the new para.
+    
     Args:
         para_elem: The <para> element to process
         
@@ -89,117 +172,202 @@ def combine_phrases_in_para(para_elem: ET.Element) -> ET.Element:
     # Create new para element with same attributes
     new_para = ET.Element("para", para_elem.attrib)
     
-    # Collect all inline elements (phrase, emphasis, subscript, superscript)
-    inline_elements = []
+    # Zero or one child: nothing to merge, emit directly
+    if len(para_elem) <= 1:
+        key = _group_key(para_elem[0]) if len(para_elem) else None
+        if key is None:
+            if para_elem.text:
+                new_para.text = para_elem.text
+        else:
+            new_para.text = ''
+            _emit_group(new_para, None, key, [para_elem[0].text or ''])
+        return new_para
+    
+    prev_key = None
+    prev_elem = None
+    buf: List[str] = []
     
     for child in para_elem:
-        if child.tag in ('phrase', 'emphasis', 'subscript', 'superscript'):
-            # Store: (tag, attrs, text, role)
-            font_name = child.get('font', '')
-            role = child.get('role', get_emphasis_role(font_name))
-            text = child.text or ''
-            attrs = normalize_attributes(child.attrib)
-            
-            inline_elements.append({
-                'tag': child.tag,
-                'attrs': attrs,
-                'text': text,
-                'role': role,
-                'font': font_name
-            })
-    
-    if not inline_elements:
+        key = _group_key(child)
+        if key is None:
+            continue
+        
+        if key == prev_key:
+            buf.append(child.text or '')
+            continue
+        
+        if prev_key is None:
+            # First inline element - para.text holds leading plain text only
+            new_para.text = ''
+        else:
+            prev_elem = _emit_group(new_para, prev_elem, prev_key, buf)
+        buf = [child.text or '']
+        prev_key = key
+    
+    if prev_key is None:
         # No inline elements, just copy any text
         if para_elem.text:
             new_para.text = para_elem.text
         return new_para
     
-    # Group consecutive elements with same formatting
-    merged_groups = []
-    current_group = None
-    
-    for elem in inline_elements:
-        # Determine the element type for this text
-        if elem['tag'] in ('subscript', 'superscript'):
-            # Keep subscript/superscript as-is
-            elem_type = elem['tag']
-            elem_role = None
-        elif elem['tag'] == 'emphasis' and elem['role']:
-            # Already has explicit role
-            elem_type = 'emphasis'
-            elem_role = elem['role']
-        elif elem['role']:
-            # Phrase with font-based role
-            elem_type = 'emphasis'
-            elem_role = elem['role']
-        else:
-            # Regular text
-            elem_type = 'text'
-            elem_role = None
+    # Don't forget the last group
+    _emit_group(new_para, prev_elem, prev_key, buf)
+    
+    return new_para
+
+
+_ATTR_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#09;'}
+
+# Bound to the xml: prefix by definition; never declared
+_XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+
+
+def _collect_namespaces(elems) -> dict:
+    """
+    Map every namespace URI used by elems (tags and attribute names) to a prefix.
+
+    Prefixes are assigned like ElementTree's: xml for the XML namespace,
+    then ns0, ns1, ... in document order.
+    """
+    namespaces = {_XML_NAMESPACE: 'xml'}
+    for node in elems:
+        for name in (node.tag, *node.attrib):
+            if name[:1] == '{':
+                uri = name[1:].partition('}')[0]
+                if uri not in namespaces:
+                    namespaces[uri] = f'ns{len(namespaces) - 1}'
+    return namespaces
+
+
+def _qname(name: str, namespaces: dict) -> str:
+    """Clark-notation name ({uri}local) as prefix:local; plain names are unchanged."""
+    if name[:1] != '{':
+        return name
+    uri, _, local = name[1:].partition('}')
+    return f'{namespaces[uri]}:{local}'
+
+
+def _namespace_decls(namespaces: dict) -> str:
+    """xmlns:prefix declarations for namespaces (the xml prefix excluded), sorted like ElementTree's."""
+    return ''.join(
+        f' xmlns:{prefix}="{escape(uri, _ATTR_ENTITIES)}"'
+        for uri, prefix in sorted(namespaces.items(), key=lambda item: item[1])
+        if uri != _XML_NAMESPACE
+    )
+
+
+def _attrs_xml(attrib: dict, namespaces: dict) -> str:
+    """Serialize an attribute dict the way ElementTree does (leading space, double quotes)."""
+    return ''.join(f' {_qname(k, namespaces)}="{escape(v, _ATTR_ENTITIES)}"' for k, v in attrib.items())
+
+
+def _group_xml(key: Tuple, parts: List[str]) -> str:
+    """Serialize one merged group: escaped text, or a single inline element."""
+    text = escape(''.join(parts))
+    elem_type, elem_role = key[0], key[1]
+    if elem_type == 'text':
+        return text
+    
+    open_tag = f'<{elem_type} role="{escape(elem_role, _ATTR_ENTITIES)}"' if elem_role else f'<{elem_type}'
+    if not text:
+        return open_tag + ' />'
+    return f'{open_tag}>{text}</{elem_type}>'
+
+
+def combine_phrases_in_para_xml(para_elem: ET.Element, namespaces: Optional[dict] = None) -> str:
+    """
+    String-writer variant of combine_phrases_in_para.
+    
+    Produces the serialized combined <para>...</para> (same markup as
+    ET.tostring(combine_phrases_in_para(para_elem)), without tail) straight
+    into a list buffer, so no ET.Element/SubElement objects are allocated.
+    
+    Args:
+        para_elem: The <para> element to process
+        namespaces: URI -> prefix map already declared by an enclosing
+            element; when None, namespaced attribute names on the para are
+            declared on the para itself
         
-        # Check if we can merge with current group
-        can_merge = (
-            current_group is not None and
-            current_group['type'] == elem_type and
-            current_group['role'] == elem_role and
-            normalize_attributes(current_group['attrs']) == elem['attrs']
-        )
+    Returns:
+        The combined para as an XML string
+    """
+    decls = ''
+    if namespaces is None:
+        # Only the para's own attributes survive; inline children are unqualified
+        namespaces = _collect_namespaces((para_elem,))
+        decls = _namespace_decls(namespaces)
+    out = ['<para', decls, _attrs_xml(para_elem.attrib, namespaces)]
+    
+    prev_key = None
+    buf: List[str] = []
+    content = ['>']
+    
+    for child in para_elem:
+        key = _group_key(child)
+        if key is None:
+            continue
         
-        if can_merge:
-            # Merge text into current group
-            current_group['text'] += elem['text']
-        else:
-            # Start new group
-            if current_group:
-                merged_groups.append(current_group)
-            current_group = {
-                'type': elem_type,
-                'role': elem_role,
-                'text': elem['text'],
-                'attrs': elem['attrs']
-            }
+        if key == prev_key:
+            buf.append(child.text or '')
+            continue
+        
+        if prev_key is not None:
+            content.append(_group_xml(prev_key, buf))
+        buf = [child.text or '']
+        prev_key = key
     
-    # Don't forget the last group
-    if current_group:
-        merged_groups.append(current_group)
-    
-    # Build the new para content with mixed content (text + inline elements)
-    if merged_groups:
-        # First group - might be plain text or inline element
-        first = merged_groups[0]
-        if first['type'] == 'text':
-            # Plain text goes directly in para.text
-            new_para.text = first['text']
-            start_idx = 1
-        else:
-            # First element is inline - para.text is empty
-            new_para.text = ''
-            start_idx = 0
+    if prev_key is None:
+        # No inline elements, just copy any text
+        if para_elem.text:
+            content.append(escape(para_elem.text))
+    else:
+        content.append(_group_xml(prev_key, buf))
+    
+    if len(content) == 1 or not any(content[1:]):
+        out.append(' />')
+    else:
+        out.extend(content)
+        out.append('</para>')
+    return ''.join(out)
+
+
+def _write_combined(elem: ET.Element, write, namespaces: Optional[dict] = None) -> int:
+    """
+    Serialize elem to write(), emitting every para through the string writer.
+    
+    Namespaced tags and attribute names ({uri}local) are written with
+    prefixes; the root call collects them and declares them on elem, as
+    ElementTree does. A para's tail is written after it, as for any element.
+    
+    Returns:
+        Number of para elements written
+    """
+    if elem.tag == 'para':
+        # A para at the root declares its own namespaces
+        write(combine_phrases_in_para_xml(elem, namespaces))
+        count = 1
+    else:
+        decls = ''
+        if namespaces is None:
+            namespaces = _collect_namespaces(elem.iter())
+            decls = _namespace_decls(namespaces)
         
-        # Add remaining groups as inline elements
-        prev_elem = None
-        for group in merged_groups[start_idx:]:
-            if group['type'] == 'text':
-                # Plain text - add as tail of previous element
-                if prev_elem is not None:
-                    prev_elem.tail = (prev_elem.tail or '') + group['text']
-                else:
-                    # Shouldn't happen if first was inline, but handle it
-                    new_para.text = (new_para.text or '') + group['text']
-            else:
-                # Create inline element
-                if group['type'] == 'emphasis':
-                    elem = ET.SubElement(new_para, 'emphasis')
-                    if group['role']:
-                        elem.set('role', group['role'])
-                elif group['type'] in ('subscript', 'superscript'):
-                    elem = ET.SubElement(new_para, group['type'])
-                
-                elem.text = group['text']
-                elem.tail = ''
-                prev_elem = elem
+        count = 0
+        tag = _qname(elem.tag, namespaces)
+        write(f'<{tag}{decls}{_attrs_xml(elem.attrib, namespaces)}')
+        if elem.text or len(elem):
+            write('>')
+            if elem.text:
+                write(escape(elem.text))
+            for child in elem:
+                count += _write_combined(child, write, namespaces)
+            write(f'</{tag}>')
+        else:
+            write(' />')
     
-    return new_para
+    if elem.tail:
+        write(escape(elem.tail))
+    return count
 
 
 def indent_xml(elem, level=0):
@@ -222,39 +390,50 @@ def indent_xml(elem, level=0):
             elem.tail = indent
 
 
-def process_xml_file(input_path: Path, output_path: Path) -> None:
+def process_xml_file(input_path: Path, output_path: Path, compact: bool = False) -> None:
     """
     Process an XML file, combining phrases in all para elements.
     
     Args:
         input_path: Path to input XML file
         output_path: Path to output XML file
+        compact: If True, skip pretty-printing and stream combined paras
+                 straight to the output via the string writer (fast path)
     """
     print(f"Reading {input_path}...")
     tree = ET.parse(input_path)
     root = tree.getroot()
     
+    if compact:
+        print(f"Writing {output_path}...")
+        with open(output_path, 'w', encoding='utf-8') as out:
+            out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            para_count = _write_combined(root, out.write)
+        print(f"Processed {para_count} para elements")
+        print("Done!")
+        return
+    
+    # Map every element to (parent, index) in one walk, keyed on id() so each
+    # para's parent and position are an O(1) lookup instead of a tree scan
+    parent_idx = {}
+    for p in root.iter():
+        for i, c in enumerate(p):
+            parent_idx[id(c)] = (p, i)
+    
     # Find all para elements in the document
     para_count = 0
-    for para in root.iter('para'):
-        # Replace para element with combined version
-        parent = None
-        for p in root.iter():
-            if para in list(p):
-                parent = p
-                break
+    for para in list(root.iter('para')):
+        entry = parent_idx.get(id(para))
+        if entry is None:
+            continue
         
-        if parent is not None:
-            # Get the position of this para in parent
-            para_index = list(parent).index(para)
-            
-            # Create combined para
-            new_para = combine_phrases_in_para(para)
-            
-            # Replace in parent
-            parent.remove(para)
-            parent.insert(para_index, new_para)
-            para_count += 1
+        # Replace para element with combined version in place, keeping the
+        # text that follows it (the compact writer keeps it too)
+        parent, para_index = entry
+        new_para = combine_phrases_in_para(para)
+        new_para.tail = para.tail
+        parent[para_index] = new_para
+        para_count += 1
     
     print(f"Processed {para_count} para elements")
     
@@ -274,19 +453,23 @@ def process_xml_file(input_path: Path, output_path: Path) -> None:
 
 def main():
     """Main entry point."""
-    if len(sys.argv) != 3:
-        print("Usage: python combine_phrases_in_para.py input.xml output.xml")
+    args = sys.argv[1:]
+    compact = '--compact' in args
+    args = [arg for arg in args if arg != '--compact']
+    
+    if len(args) != 2:
+        print("Usage: python combine_phrases_in_para.py input.xml output.xml [--compact]")
         sys.exit(1)
     
-    input_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2])
+    input_path = Path(args[0])
+    output_path = Path(args[1])
     
     if not input_path.exists():
         print(f"Error: Input file not found: {input_path}")
         sys.exit(1)
     
     try:
-        process_xml_file(input_path, output_path)
+        process_xml_file(input_path, output_path, compact)
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -3,8 +3,14 @@
 Debug script to see what drawings PyMuPDF finds on a page.
 """
 
-import fitz
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import islice
+
+import fitz
 
 def debug_page_drawings(pdf_path: str, page_num: int, bbox=None):
     """Show all drawings on a page."""
@@ -17,39 +23,39 @@ def debug_page_drawings(pdf_path: str, page_num: int, bbox=None):
     print(f"\nTotal drawings on page: {len(drawings)}")
     
     if bbox:
-        x1, y1, x2, y2 = bbox
-        print(f"\nFiltering for bbox: ({x1:.1f}, {y1:.1f}, {x2:.1f}, {y2:.1f})")
+        fx1, fy1, fx2, fy2 = bbox
+        print(f"\nFiltering for bbox: ({fx1:.1f}, {fy1:.1f}, {fx2:.1f}, {fy2:.1f})")
     
     for i, drawing in enumerate(drawings):
-        draw_rect = drawing.get('rect')
+        dr = drawing.get
+        draw_rect = dr('rect')
         
-        # Check if in bbox
+        # Check if in bbox (inclusive: drawings touching its edge, and
+        # zero-width/height rules, still count)
         if bbox:
             dx1, dy1, dx2, dy2 = draw_rect
-            if dx2 < x1 or dx1 > x2 or dy2 < y1 or dy1 > y2:
+            if dx2 < fx1 or dx1 > fx2 or dy2 < fy1 or dy1 > fy2:
                 continue
         
         print(f"\n{'='*60}")
         print(f"Drawing {i}:")
         print(f"  Rect: {draw_rect}")
-        print(f"  Color: {drawing.get('color')}")
-        print(f"  Fill: {drawing.get('fill')}")
-        print(f"  Width: {drawing.get('width')}")
+        print(f"  Color: {dr('color')}")
+        print(f"  Fill: {dr('fill')}")
+        print(f"  Width: {dr('width')}")
         
-        items = drawing.get('items', [])
+        items = dr('items', [])
         print(f"  Items ({len(items)}):")
         
-        for j, item in enumerate(items[:20]):  # Show first 20 items
+        for j, item in enumerate(islice(items, 20)):  # Show first 20 items
             cmd = item[0]
             print(f"    [{j}] Command: {cmd}", end='')
             
             if cmd == 'l' and len(item) >= 3:
                 try:
                     p1, p2 = item[1], item[2]
-                    x1, y1 = float(p1.x), float(p1.y)
-                    x2, y2 = float(p2.x), float(p2.y)
-                    line_type = "horizontal" if abs(y2 - y1) < 2 else "vertical" if abs(x2 - x1) < 2 else "diagonal"
-                    print(f" (line: {x1:.1f},{y1:.1f} -> {x2:.1f},{y2:.1f}) [{line_type}]")
+                    line_type = "horizontal" if abs(p2.y - p1.y) < 2 else "vertical" if abs(p2.x - p1.x) < 2 else "diagonal"
+                    print(f" (line: {p1.x:.1f},{p1.y:.1f} -> {p2.x:.1f},{p2.y:.1f}) [{line_type}]")
                 except:
                     print(f" (line - parse error)")
             elif cmd == 're' and len(item) >= 2:
@@ -70,9 +76,66 @@ def debug_page_drawings(pdf_path: str, page_num: int, bbox=None):
     
     doc.close()
 
+def parse_page_range(spec: str) -> list:
+    """
+    Parse a page spec like "3", "0-9" or "1,4,10-12" into sorted page indices.
+
+    Pages are 0-based, as PyMuPDF indexes them; demonstrate_cropping.py
+    shares this helper and convention.
+    """
+    pages = set()
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            pages.update(range(int(start), int(end) + 1))
+        else:
+            pages.add(int(part))
+    return sorted(pages)
+
+
+def _debug_page_worker(task) -> str:
+    """Process-pool worker: reopen the PDF locally and capture the page report."""
+    pdf_path, page_num, bbox = task
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        debug_page_drawings(pdf_path, page_num, bbox)
+    return buf.getvalue()
+
+
+def debug_pages_parallel(pdf_path: str, page_nums: list, bbox=None) -> None:
+    """
+    Run debug_page_drawings over several pages in a process pool.
+
+    fitz.Document is not picklable, so each worker gets the path and page
+    index and opens the PDF itself. Reports are printed in page order.
+    """
+    if not page_nums:
+        return
+    if len(page_nums) == 1:
+        debug_page_drawings(pdf_path, page_nums[0], bbox)
+        return
+    
+    workers = min(os.cpu_count() or 1, len(page_nums))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [(pdf_path, page_num, bbox) for page_num in page_nums]
+        for report in executor.map(_debug_page_worker, tasks):
+            sys.stdout.write(report)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
+    args = sys.argv[1:]
+    pages_spec = None
+    if "--pages" in args:
+        i = args.index("--pages")
+        pages_spec = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    
+    min_args = 1 if pages_spec else 2
+    if len(args) < min_args or pages_spec == "":
         print("Usage: python debug_drawings.py <pdf_path> <page_num> [x1 y1 x2 y2]")
+        print("       python debug_drawings.py <pdf_path> --pages 0-9 [x1 y1 x2 y2]")
         print("\nExample tables from multimedia.xml:")
         print("  Page 21: Table at (147.54, 251.49, 405.67, 349.63)")
         print("  Page 25: Table at (211.96, 186.30, 323.59, 282.91)")
@@ -80,11 +143,19 @@ if __name__ == "__main__":
         print("  Page 53: Table at (105.77, 346.36, 430.94, 467.65)")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
-    page_num = int(sys.argv[2])
+    pdf_path = args[0]
+    if pages_spec:
+        page_nums = parse_page_range(pages_spec)
+        if not page_nums:
+            print(f"No pages selected by --pages {pages_spec!r}")
+            sys.exit(1)
+        bbox_args = args[1:]
+    else:
+        page_nums = [int(args[1])]
+        bbox_args = args[2:]
     
     bbox = None
-    if len(sys.argv) >= 7:
-        bbox = tuple(map(float, sys.argv[3:7]))
+    if len(bbox_args) >= 4:
+        bbox = tuple(map(float, bbox_args[:4]))
     
-    debug_page_drawings(pdf_path, page_num, bbox)
+    debug_pages_parallel(pdf_path, page_nums, bbox)
@@ -5,15 +5,33 @@ Visual demonstration of full-page image cropping.
 Creates side-by-side comparison of cropped vs uncropped images.
 """
 
+import argparse
+import io
+import os
 import sys
-import tempfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
 import fitz
 from PIL import Image, ImageDraw, ImageFont
 
 from Multipage_Image_Extractor import render_full_page_as_image
+from debug_drawings import parse_page_range
+
+
+def _load_font(path: str, size: int):
+    """Load a TrueType font, falling back to PIL's default bitmap font."""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+# Parsed once per process instead of on every comparison
+_FONT_LARGE = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
+_FONT_SMALL = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
 
 
 def create_comparison(pdf_path: str, page_num: int = 0):
@@ -34,139 +52,159 @@ def create_comparison(pdf_path: str, page_num: int = 0):
     page = doc[page_num]
     print(f"Page size: {page.rect.width:.1f} × {page.rect.height:.1f} points")
     
-    # Create temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Render UNCROPPED version
-        print("\n1. Rendering UNCROPPED version...")
-        page_el_uncropped = ET.Element("page", {"number": str(page_num + 1)})
-        render_full_page_as_image(
-            page=page,
-            page_no=page_num + 1,
-            media_dir=str(temp_path),
-            page_el=page_el_uncropped,
-            dpi=150,
-            reason="Demo: Uncropped",
-            crop_margins=False,
-        )
-        uncropped_path = temp_path / f"page{page_num + 1}_fullpage.png"
-        img_uncropped = Image.open(uncropped_path)
-        print(f"   Size: {img_uncropped.width} × {img_uncropped.height} pixels")
-        
-        # Remove and render CROPPED version
-        uncropped_path.unlink()
-        print("\n2. Rendering CROPPED version...")
-        page_el_cropped = ET.Element("page", {"number": str(page_num + 1)})
-        render_full_page_as_image(
-            page=page,
-            page_no=page_num + 1,
-            media_dir=str(temp_path),
-            page_el=page_el_cropped,
-            dpi=150,
-            reason="Demo: Cropped",
-            crop_margins=True,
-            header_margin_pct=0.08,
-            footer_margin_pct=0.08,
-            left_margin_pct=0.05,
-            right_margin_pct=0.05,
-        )
-        cropped_path = temp_path / f"page{page_num + 1}_fullpage.png"
-        img_cropped = Image.open(cropped_path)
-        print(f"   Size: {img_cropped.width} × {img_cropped.height} pixels")
-        
-        # Calculate reduction
-        width_reduction = (1 - img_cropped.width / img_uncropped.width) * 100
-        height_reduction = (1 - img_cropped.height / img_uncropped.height) * 100
-        
-        print(f"\n{'='*80}")
-        print("RESULTS")
-        print(f"{'='*80}")
-        print(f"Width reduction:  {width_reduction:.1f}%")
-        print(f"Height reduction: {height_reduction:.1f}%")
-        print(f"File size before: {uncropped_path.stat().st_size if uncropped_path.exists() else 'N/A'}")
-        print(f"File size after:  {cropped_path.stat().st_size}")
-        
-        # Create side-by-side comparison
-        print(f"\n3. Creating comparison image...")
-        
-        # Resize for display (max width 800px per image)
-        max_width = 800
-        if img_uncropped.width > max_width or img_cropped.width > max_width:
-            scale = min(max_width / img_uncropped.width, max_width / img_cropped.width)
-            new_width_u = int(img_uncropped.width * scale)
-            new_height_u = int(img_uncropped.height * scale)
-            new_width_c = int(img_cropped.width * scale)
-            new_height_c = int(img_cropped.height * scale)
-            img_uncropped = img_uncropped.resize((new_width_u, new_height_u), Image.Resampling.LANCZOS)
-            img_cropped = img_cropped.resize((new_width_c, new_height_c), Image.Resampling.LANCZOS)
-        
-        # Create comparison canvas
-        gap = 40
-        label_height = 60
-        canvas_width = img_uncropped.width + gap + img_cropped.width + 40
-        canvas_height = max(img_uncropped.height, img_cropped.height) + label_height + 40
-        
-        canvas = Image.new('RGB', (canvas_width, canvas_height), 'white')
-        draw = ImageDraw.Draw(canvas)
-        
-        # Paste images
-        x1 = 20
-        y1 = label_height + 20
-        canvas.paste(img_uncropped, (x1, y1))
-        
-        x2 = x1 + img_uncropped.width + gap
-        canvas.paste(img_cropped, (x2, y1))
-        
-        # Draw labels
-        try:
-            # Try to use a nice font if available
-            font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-            font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-        except:
-            # Fallback to default font
-            font_large = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-        
-        # Title
-        title = "Full-Page Image Cropping: Before & After"
-        title_bbox = draw.textbbox((0, 0), title, font=font_large)
-        title_width = title_bbox[2] - title_bbox[0]
-        draw.text(((canvas_width - title_width) // 2, 10), title, fill='black', font=font_large)
-        
-        # Labels for each image
-        label1 = f"BEFORE (Uncropped)\n{img_uncropped.width}×{img_uncropped.height}px"
-        label2 = f"AFTER (Cropped)\n{img_cropped.width}×{img_cropped.height}px\n-{width_reduction:.1f}% width, -{height_reduction:.1f}% height"
-        
-        # Draw red box around uncropped to show what gets cropped
-        draw.rectangle([x1-2, y1-2, x1+img_uncropped.width+2, y1+img_uncropped.height+2], outline='red', width=3)
-        draw.text((x1 + 10, y1 - 50), label1, fill='red', font=font_small)
-        
-        # Draw green box around cropped
-        draw.rectangle([x2-2, y1-2, x2+img_cropped.width+2, y1+img_cropped.height+2], outline='green', width=3)
-        draw.text((x2 + 10, y1 - 50), label2, fill='green', font=font_small)
-        
-        # Save comparison
-        comparison_path = Path(f"fullpage_cropping_comparison_page{page_num+1}.png")
-        canvas.save(comparison_path)
-        print(f"   Saved: {comparison_path}")
-        print(f"\n{'='*80}")
-        print(f"✓ Comparison image created: {comparison_path}")
-        print(f"{'='*80}\n")
+    # Render UNCROPPED version (kept in memory - no PNG round-trip through disk)
+    print("\n1. Rendering UNCROPPED version...")
+    page_el_uncropped = ET.Element("page", {"number": str(page_num + 1)})
+    img_uncropped = render_full_page_as_image(
+        page=page,
+        page_no=page_num + 1,
+        media_dir="",
+        page_el=page_el_uncropped,
+        dpi=150,
+        reason="Demo: Uncropped",
+        crop_margins=False,
+        return_image=True,
+    )
+    print(f"   Size: {img_uncropped.width} × {img_uncropped.height} pixels")
+    
+    # Render CROPPED version
+    print("\n2. Rendering CROPPED version...")
+    page_el_cropped = ET.Element("page", {"number": str(page_num + 1)})
+    img_cropped = render_full_page_as_image(
+        page=page,
+        page_no=page_num + 1,
+        media_dir="",
+        page_el=page_el_cropped,
+        dpi=150,
+        reason="Demo: Cropped",
+        crop_margins=True,
+        header_margin_pct=0.08,
+        footer_margin_pct=0.08,
+        left_margin_pct=0.05,
+        right_margin_pct=0.05,
+        return_image=True,
+    )
+    print(f"   Size: {img_cropped.width} × {img_cropped.height} pixels")
+    
+    # Calculate reduction
+    width_reduction = (1 - img_cropped.width / img_uncropped.width) * 100
+    height_reduction = (1 - img_cropped.height / img_uncropped.height) * 100
+    
+    print(f"\n{'='*80}")
+    print("RESULTS")
+    print(f"{'='*80}")
+    print(f"Width reduction:  {width_reduction:.1f}%")
+    print(f"Height reduction: {height_reduction:.1f}%")
+    print(f"Pixels before: {img_uncropped.width * img_uncropped.height}")
+    print(f"Pixels after:  {img_cropped.width * img_cropped.height}")
+    
+    # Create side-by-side comparison
+    print(f"\n3. Creating comparison image...")
+    
+    # Downscale in place for display (max width 800px per image). Both images
+    # share one scale factor so the crop stays visually comparable; thumbnail
+    # box-reduces before the LANCZOS pass and is a no-op when already small.
+    max_width = 800
+    scale = min(max_width / img_uncropped.width, max_width / img_cropped.width)
+    if scale < 1:
+        for img in (img_uncropped, img_cropped):
+            img.thumbnail(
+                (max(1, int(img.width * scale)), max(1, int(img.height * scale))),
+                Image.Resampling.LANCZOS,
+            )
+    
+    # Create comparison canvas
+    gap = 40
+    label_height = 60
+    canvas_width = img_uncropped.width + gap + img_cropped.width + 40
+    canvas_height = max(img_uncropped.height, img_cropped.height) + label_height + 40
+    
+    canvas = Image.new('RGB', (canvas_width, canvas_height), 'white')
+    draw = ImageDraw.Draw(canvas)
     
+    # Paste images
+    x1 = 20
+    y1 = label_height + 20
+    canvas.paste(img_uncropped, (x1, y1))
+    
+    x2 = x1 + img_uncropped.width + gap
+    canvas.paste(img_cropped, (x2, y1))
+    
+    # Draw labels
+    font_large = _FONT_LARGE
+    font_small = _FONT_SMALL
+    
+    # Title
+    title = "Full-Page Image Cropping: Before & After"
+    title_bbox = draw.textbbox((0, 0), title, font=font_large)
+    title_width = title_bbox[2] - title_bbox[0]
+    draw.text(((canvas_width - title_width) // 2, 10), title, fill='black', font=font_large)
+    
+    # Labels for each image
+    label1 = f"BEFORE (Uncropped)\n{img_uncropped.width}×{img_uncropped.height}px"
+    label2 = f"AFTER (Cropped)\n{img_cropped.width}×{img_cropped.height}px\n-{width_reduction:.1f}% width, -{height_reduction:.1f}% height"
+    
+    # Draw red box around uncropped to show what gets cropped
+    draw.rectangle([x1-2, y1-2, x1+img_uncropped.width+2, y1+img_uncropped.height+2], outline='red', width=3)
+    draw.text((x1 + 10, y1 - 50), label1, fill='red', font=font_small)
+    
+    # Draw green box around cropped
+    draw.rectangle([x2-2, y1-2, x2+img_cropped.width+2, y1+img_cropped.height+2], outline='green', width=3)
+    draw.text((x2 + 10, y1 - 50), label2, fill='green', font=font_small)
+    
+    # Save comparison
+    comparison_path = Path(f"fullpage_cropping_comparison_page{page_num+1}.png")
+    canvas.save(comparison_path)
+    print(f"   Saved: {comparison_path}")
+    print(f"\n{'='*80}")
+    print(f"✓ Comparison image created: {comparison_path}")
+    print(f"{'='*80}\n")
+
     doc.close()
 
 
-def main():
-    # Find a PDF to demonstrate with
-    pdf_files = list(Path(".").glob("*.pdf"))
-    if not pdf_files:
-        print("Error: No PDF files found in current directory")
+def _comparison_worker(task) -> str:
+    """Process-pool worker: build one page's comparison and return its log."""
+    pdf_path, page_num = task
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        create_comparison(pdf_path, page_num=page_num)
+    return buf.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-page image cropping demo")
+    parser.add_argument("pdf_path", nargs="?", help="PDF to render (default: first PDF in cwd)")
+    parser.add_argument("--pages", default="0",
+                        help="0-based pages to compare, e.g. '0', '0-4', '0,2,7-9' (default: 0)")
+    args = parser.parse_args(argv)
+    
+    if args.pdf_path:
+        pdf_path = Path(args.pdf_path)
+    else:
+        # Find a PDF to demonstrate with
+        pdf_files = list(Path(".").glob("*.pdf"))
+        if not pdf_files:
+            print("Error: No PDF files found in current directory")
+            return 1
+        # Use first PDF
+        pdf_path = pdf_files[0]
+    
+    page_nums = parse_page_range(args.pages)
+    if not page_nums:
+        print(f"Error: No pages selected by --pages {args.pages!r}")
         return 1
+    if len(page_nums) == 1:
+        create_comparison(str(pdf_path), page_num=page_nums[0])
+        return 0
     
-    # Use first PDF
-    pdf_path = pdf_files[0]
-    create_comparison(str(pdf_path), page_num=0)
+    # Pages are independent: each worker reopens the PDF (fitz.Document is not
+    # picklable) and renders its page; logs are printed in page order.
+    workers = min(os.cpu_count() or 1, len(page_nums))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [(str(pdf_path), page_num) for page_num in page_nums]
+        for log in executor.map(_comparison_worker, tasks):
+            sys.stdout.write(log)
     
     return 0
 
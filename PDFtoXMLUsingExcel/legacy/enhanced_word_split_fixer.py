@@ -18,185 +18,259 @@ in the final XML.  The heuristics expect this helper to normalise text.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import Callable, Optional
 
 # Precompiled regular expressions reused in the cleaner
-_HYPHEN_LINEBREAK_RE = re.compile(r"(\w)-\s*\n\s*(\w)")
-_SOFT_LINEBREAK_RE = re.compile(r"([^\s-])\s*\n\s*([a-z])")
+# Line-break and flattened-hyphen splits, matched in a single scan (see
+# _fix_linebreak_splits).  The characters around each split are only looked
+# at, never consumed, so every alternative sees its original neighbours.
+_LINEBREAK_SPLIT_RE = re.compile(
+    r"(?<=\w)(-)\s*\n\s*(?=\w)"           # 1: "AI-\nassisted" -> "AI-assisted"
+    r"|(?<=[^\s-])(\s*\n\s*)(?=[a-z])"     # 2: "comput\nation" -> "comput ation"
+    r"|(?<=\w\w)(- )(?=([a-z]{2,}))"       # 3/4: "man- agement" -> "management"
+)
 _LIGATURE_SPACING_RE = re.compile(r"(\w)\s{2,}(\w)")
 _MULTISPACE_RE = re.compile(r"[ \t]{2,}")
-# Pattern for end-of-line hyphenation already flattened (hyphen + space + lowercase continuation)
-# Matches: "man- agement", "Mag- netic" but not "MRI-" at end or "AI- " before uppercase
-_HYPHEN_SPACE_CONTINUATION_RE = re.compile(r"(\w{2,})- ([a-z]{2,})")
+# Residual single line break between two non-space characters (mid-word)
+_MIDWORD_NEWLINE_RE = re.compile(r"(\S)\n(\S)")
 # Pattern for direct hyphenation without space (common in PDF extraction)
 # Matches: "elec-tromagnetic", "in-cluding" where hyphen breaks a single word
 _DIRECT_HYPHEN_RE = re.compile(r"\w-[a-z]")
+# Full word-hyphen-word form of the above, capturing both sides of the hyphen
+# Matches: "elec-tromagnetic", "in-cluding", "MRI-re-lated"
+_DIRECT_HYPHEN_SPLIT_RE = re.compile(r"(\w+)-([a-z]{2,})")
 
 # Pattern for single-space word splits from PDF kerning
 # Matches patterns like "Com pany", "Se nior", "Proj ect" where space splits a word
 # Extended to catch fragments up to 8 chars for suffixes like "nization", "agement"
 # Also matches when followed by digits (e.g., "Com pany1915")
 _SINGLE_SPACE_SPLIT_RE = re.compile(r"([A-Za-z]{2,}) ([a-z]{1,8})(?=[\s\.,;:!?\)\]\"\'\d]|$)")
+# A kerning split only ever spans letter runs joined by single spaces; anything
+# else ends the chain, and matches on either side of it cannot affect each other
+_SPLIT_CHAIN_BREAK_RE = re.compile(r"[^A-Za-z ]| {2}")
+
+# Second-pass kerning pairs ("defi nition"): a whole space-delimited token ending in
+# a letter, then a token that could be a fragment - a lowercase start, at most 8
+# letters, optional trailing punctuation/digits.  The right token is only looked
+# at, so when a pair is rejected it can still start the next pair.
+_KERNING_PAIR_RE = re.compile(
+    r"(?<![^ ])([^ ]*[^\W\d_]) "
+    r"(?=([a-z\u0131\u017f][A-Za-z\u0130\u0131\u017f\u212a]{0,7}\n?[.,;:!?'\")\\d0-9]*)(?: |\Z))"
+)
+# Characters stripped from the right token before the fragment lookup
+_FRAGMENT_TRAILING_CHARS = ".,;:!?'\")\\d0123456789"
 
 # Common word fragment patterns that indicate a single space is incorrectly splitting a word
 # These are fragments that are NOT standalone English words and should be rejoined
 # Includes very short fragments (1-2 chars) that commonly appear in kerning splits
-_KERNING_FRAGMENT_PATTERNS = re.compile(
-    r"^("
+_KERNING_FRAGMENTS = frozenset({
     # Single character fragments (often from kerning)
-    r"c|i|a|e|o|u|"
+    "c", "i", "a", "e", "o", "u",
     # Two-character fragments
-    r"ca|ce|ci|co|cu|"
-    r"ga|ge|gi|go|gu|"
-    r"re|ri|ro|ru|"
-    r"na|ne|ni|no|nu|"
-    r"ta|te|ti|to|tu|"
-    r"ba|be|bi|bo|bu|"
-    r"la|le|li|lo|lu|"
-    r"ma|me|mi|mo|mu|"
-    r"pa|pe|pi|po|pu|"
-    r"sa|se|si|so|su|"
-    r"ag|"
+    "ca", "ce", "ci", "co", "cu",
+    "ga", "ge", "gi", "go", "gu",
+    "re", "ri", "ro", "ru",
+    "na", "ne", "ni", "no", "nu",
+    "ta", "te", "ti", "to", "tu",
+    "ba", "be", "bi", "bo", "bu",
+    "la", "le", "li", "lo", "lu",
+    "ma", "me", "mi", "mo", "mu",
+    "pa", "pe", "pi", "po", "pu",
+    "sa", "se", "si", "so", "su",
+    "ag",
     # Three-character fragments
-    r"ect|cal|ics|ous|nal|ial|"
-    r"ity|ary|ory|ery|"
+    "ect", "cal", "ics", "ous", "nal", "ial",
+    "ity", "ary", "ory", "ery",
     # Four-character fragments
-    r"pany|nior|ally|nifi|bral|tion|sion|ment|ness|city|"
-    r"ical|ious|eous|tive|able|ible|ular|"
-    r"lish|nize|ture|"
+    "pany", "nior", "ally", "nifi", "bral", "tion", "sion", "ment", "ness", "city",
+    "ical", "ious", "eous", "tive", "able", "ible", "ular",
+    "lish", "nize", "ture",
     # Five-character fragments
-    r"ction|ation|ition|ution|nally|tions|sions|ments|cally|"
-    r"ially|ually|ously|ively|"
-    r"glish|"  # En glish
+    "ction", "ation", "ition", "ution", "nally", "tions", "sions", "ments", "cally",
+    "ially", "ually", "ously", "ively",
+    "glish",  # En glish
     # Longer common suffixes
-    r"nition|nitions|nization|ization|izations|"
-    r"agement|agements|"
-    r"ference|ferences|"
-    r"brate|brated|brating|"
+    "nition", "nitions", "nization", "ization", "izations",
+    "agement", "agements",
+    "ference", "ferences",
+    "brate", "brated", "brating",
     # Legacy patterns from original list
-    r"er|ers|ter|ters|"
-    r"gy|gies|try|tries|"
-    r"nic|nics|nals|ty|ties|"
-    r"ware|ward|wards|ble|bles|bly|"
-    r"cess|cesses|cial|cially|"
-    r"tain|tains|tained|taining|"
-    r"tures|tured|turing|"
-    r"lize|lized|lizing|lization|"
-    r"tives|tively|"
-    r"ence|ences|ance|ances|"
-    r"ual|ually|ure|ures|"
-    r"cate|cated|cating|cation|cations|"
-    r"nesses|less|lessly|"
-    r"age|ages|aged|aging|"
-    r"ized|izing|"
-    r"ese|ish|dom|doms|"
-    r"ar|ars|"
-    r"or|ors|ist|ists|ism|isms|"
-    r"ful|fully|ship|ships|"
-    r"hood|hoods|like|wise|"
-    r"ways|"
-    r"cy|cies|"
-    r"th|ths|"  # "weal th", "heal th"
-    r"ly|ry|ries"  # common endings
-    r")$",
-    re.IGNORECASE
-)
+    "er", "ers", "ter", "ters",
+    "gy", "gies", "try", "tries",
+    "nic", "nics", "nals", "ty", "ties",
+    "ware", "ward", "wards", "ble", "bles", "bly",
+    "cess", "cesses", "cial", "cially",
+    "tain", "tains", "tained", "taining",
+    "tures", "tured", "turing",
+    "lize", "lized", "lizing", "lization",
+    "tives", "tively",
+    "ence", "ences", "ance", "ances",
+    "ual", "ually", "ure", "ures",
+    "cate", "cated", "cating", "cation", "cations",
+    "nesses", "less", "lessly",
+    "age", "ages", "aged", "aging",
+    "ized", "izing",
+    "ese", "ish", "dom", "doms",
+    "ar", "ars",
+    "or", "ors", "ist", "ists", "ism", "isms",
+    "ful", "fully", "ship", "ships",
+    "hood", "hoods", "like", "wise",
+    "ways",
+    "cy", "cies",
+    "th", "ths",  # "weal th", "heal th"
+    "ly", "ry", "ries",  # common endings
+})
 
 # Common word-ending suffixes that indicate the right part is a fragment, not a standalone word
 # If right part matches these patterns, it's likely a broken word that should be rejoined
-_FRAGMENT_SUFFIX_PATTERNS = re.compile(
-    r"^(tromagnetic|tromagnet|tronic|tronics|trical|tric|tron|"  # electro- breaks
-    r"cluding|clusion|clusive|clude|"  # in-clude breaks
-    r"erence|erences|ference|ferences|"  # ref-erence, dif-ference breaks
-    r"ation|ations|ment|ments|tion|tions|sion|sions|"  # common suffixes
-    r"agement|agements|"  # man-agement breaks
-    r"ity|ities|ness|nesses|ance|ances|ence|ences|"
-    r"able|ible|ably|ibly|ful|fully|less|lessly|"
-    r"ing|ings|tion|tions|ly|ment|ments|"
-    r"ized|izing|ization|ised|ising|isation|"
-    r"ology|ological|ologist|"
-    r"ular|ulars|ularly|ulate|ulated|ulating|ulation|"
-    r"ative|atively|atives|"
-    r"ous|ously|ousness|"
-    r"ical|ically|"
-    r"lated|lating|lation|lations|"  # re-lated breaks
-    r"formed|forming|formation|"  # trans-formed breaks
-    r"pared|paring|paration|"  # pre-pared breaks
-    r"vious|viously|"  # pre-vious, ob-vious breaks
-    r"netic|netics|netically|"  # mag-netic breaks
-    r"dition|ditional|ditionally|"  # con-dition, tra-dition breaks
-    r"ticular|ticularly|"  # par-ticular breaks
-    r"cording|cordingly|"  # ac-cording breaks
-    r"quent|quently|quence|"  # fre-quent, se-quence breaks
-    r"tain|tained|taining|tains|"  # con-tain, main-tain breaks
-    r"plied|plying|plication|plications|"  # ap-plied, im-plied breaks
-    r"proved|proving|provement|"  # im-proved, ap-proved breaks
-    r"duced|ducing|duction|"  # pro-duced, re-duced, in-duced breaks
-    r"posed|posing|position|"  # pro-posed, com-posed breaks
-    r"vided|viding|vision|"  # pro-vided, di-vided breaks
-    r"cessed|cessing|cess|"  # pro-cessed, ac-cess breaks
-    r"pected|pecting|pection|"  # ex-pected, in-spected breaks
-    r"signed|signing|"  # de-signed, as-signed breaks
-    r"quired|quiring|quirement|"  # re-quired, ac-quired breaks
-    r"ceived|ceiving|ception|"  # re-ceived, per-ceived breaks
-    r"sented|senting|sentation|"  # pre-sented, repre-sented breaks
-    r"veloped|veloping|velopment|"  # de-veloped breaks
-    r"termine|termined|termining|termination)$",  # de-termine breaks
-    re.IGNORECASE
-)
+_FRAGMENT_SUFFIXES = frozenset({
+    "tromagnetic", "tromagnet", "tronic", "tronics", "trical", "tric", "tron",  # electro- breaks
+    "cluding", "clusion", "clusive", "clude",  # in-clude breaks
+    "erence", "erences", "ference", "ferences",  # ref-erence, dif-ference breaks
+    "ation", "ations", "ment", "ments", "tion", "tions", "sion", "sions",  # common suffixes
+    "agement", "agements",  # man-agement breaks
+    "ity", "ities", "ness", "nesses", "ance", "ances", "ence", "ences",
+    "able", "ible", "ably", "ibly", "ful", "fully", "less", "lessly",
+    "ing", "ings", "tion", "tions", "ly", "ment", "ments",
+    "ized", "izing", "ization", "ised", "ising", "isation",
+    "ology", "ological", "ologist",
+    "ular", "ulars", "ularly", "ulate", "ulated", "ulating", "ulation",
+    "ative", "atively", "atives",
+    "ous", "ously", "ousness",
+    "ical", "ically",
+    "lated", "lating", "lation", "lations",  # re-lated breaks
+    "formed", "forming", "formation",  # trans-formed breaks
+    "pared", "paring", "paration",  # pre-pared breaks
+    "vious", "viously",  # pre-vious, ob-vious breaks
+    "netic", "netics", "netically",  # mag-netic breaks
+    "dition", "ditional", "ditionally",  # con-dition, tra-dition breaks
+    "ticular", "ticularly",  # par-ticular breaks
+    "cording", "cordingly",  # ac-cording breaks
+    "quent", "quently", "quence",  # fre-quent, se-quence breaks
+    "tain", "tained", "taining", "tains",  # con-tain, main-tain breaks
+    "plied", "plying", "plication", "plications",  # ap-plied, im-plied breaks
+    "proved", "proving", "provement",  # im-proved, ap-proved breaks
+    "duced", "ducing", "duction",  # pro-duced, re-duced, in-duced breaks
+    "posed", "posing", "position",  # pro-posed, com-posed breaks
+    "vided", "viding", "vision",  # pro-vided, di-vided breaks
+    "cessed", "cessing", "cess",  # pro-cessed, ac-cess breaks
+    "pected", "pecting", "pection",  # ex-pected, in-spected breaks
+    "signed", "signing",  # de-signed, as-signed breaks
+    "quired", "quiring", "quirement",  # re-quired, ac-quired breaks
+    "ceived", "ceiving", "ception",  # re-ceived, per-ceived breaks
+    "sented", "senting", "sentation",  # pre-sented, repre-sented breaks
+    "veloped", "veloping", "velopment",  # de-veloped breaks
+    "termine", "termined", "termining", "termination",  # de-termine breaks
+})
+
+# Non-ASCII characters that case-insensitive regex matching treats as the
+# ASCII letters used in the fragment sets (dotted/dotless i, long s, Kelvin sign)
+_FRAGMENT_CASEFOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _is_kerning_fragment(word: str) -> bool:
+    """Case-insensitive membership test against ``_KERNING_FRAGMENTS``."""
+    # The former ``^(...)$`` alternation also accepted a single trailing newline
+    if word.endswith("\n"):
+        word = word[:-1]
+    # ASCII words (nearly all PDF text) have no case-folding special cases, so
+    # only non-ASCII input pays for the translate() pass
+    if not word.isascii():
+        word = word.translate(_FRAGMENT_CASEFOLD)
+    return word.lower() in _KERNING_FRAGMENTS
+
+
+def _splice(pattern: re.Pattern[str], repl: Callable[[re.Match[str]], Optional[str]],
+            text: str) -> str:
+    """
+    ``pattern.sub(repl, text)`` for callbacks that reject most matches.
 
+    ``repl`` returns None to leave a match as it is.  Only the changed pieces
+    and the gaps between them go into a single list buffer, so rejected
+    matches are never copied and text comes back unchanged (same object)
+    when nothing was replaced.
+    """
+    out = []
+    last_end = 0
+    for match in pattern.finditer(text):
+        piece = repl(match)
+        if piece is None:
+            continue
+        start, end = match.span()
+        out.append(text[last_end:start])
+        out.append(piece)
+        last_end = end
+    if not out:
+        return text
+    out.append(text[last_end:])
+    return "".join(out)
 
-def _fix_hyphenated_linebreaks(text: str) -> str:
-    """Collapse ``word-\ncontinuation`` to ``word-continuation``."""
 
-    def _repl(match: re.Match[str]) -> str:
-        left, right = match.group(1), match.group(2)
-        return f"{left}-{right}"
+def _join_hyphen_linebreak(match: re.Match[str], ends: list) -> Optional[str]:
+    """``AI-\nassisted`` -> ``AI-assisted`` (a word char anchors one split)."""
+    if match.start() - 1 == ends[1]:
+        return None
+    ends[1] = match.end()
+    return "-"
 
-    return _HYPHEN_LINEBREAK_RE.sub(_repl, text)
 
+def _join_soft_linebreak(match: re.Match[str], ends: list) -> Optional[str]:
+    """``comput\nation`` -> ``comput ation`` (a char anchors one split)."""
+    if match.start() - 1 == ends[2]:
+        return None
+    ends[2] = match.end()
+    return " "
 
-def _fix_soft_linebreaks(text: str) -> str:
-    """
-    Replace bare line-break splits between lowercase fragments with a space.
 
-    Example::
-        ``comput\nation`` -> ``comput ation`` -> subsequently normalised.
-    """
+def _join_flattened_hyphen(match: re.Match[str], ends: list) -> Optional[str]:
+    """``man- agement`` -> ``management`` (the old pass consumed the right part)."""
+    if match.start() - ends[4] < 2:
+        return None
+    ends[4] = match.end() + len(match.group(4))
+    return ""
 
-    def _repl(match: re.Match[str]) -> str:
-        left, right = match.group(1), match.group(2)
-        return f"{left} {right}"
 
-    return _SOFT_LINEBREAK_RE.sub(_repl, text)
+# _LINEBREAK_SPLIT_RE alternatives by match.lastindex (group 3 never closes last)
+_LINEBREAK_ACTIONS = (
+    None,
+    _join_hyphen_linebreak,
+    _join_soft_linebreak,
+    None,
+    _join_flattened_hyphen,
+)
 
 
-def _fix_ligature_spacing(text: str) -> str:
-    """
-    Collapse excessive intra-word spacing often seen around ligatures.
+def _fix_linebreak_splits(text: str) -> str:
     """
+    Join words split across lines in a single scan.
 
-    def _repl(match: re.Match[str]) -> str:
-        return f"{match.group(1)}{match.group(2)}"
-
-    return _LIGATURE_SPACING_RE.sub(_repl, text)
+    Handles what used to be three sequential passes:
 
+    * ``word-\ncontinuation`` -> ``word-continuation``
+    * ``comput\nation`` -> ``comput ation`` (subsequently normalised)
+    * ``man- agement`` / ``Mag- netic`` -> ``management`` / ``Magnetic``
+      (end-of-line hyphenation already flattened to ``- ``; needs 2+ word
+      chars on the left and 2+ lowercase chars on the right)
 
-def _fix_flattened_hyphenation(text: str) -> str:
+    Each former pass consumed the characters on either side of its matches,
+    so a character could anchor at most one split per pass.  The ``ends``
+    slots below reproduce that, keeping the output identical.
     """
-    Fix end-of-line hyphenation that has been flattened to ``word- continuation``.
+    # End of the last accepted split, per alternative (indexed like the table)
+    ends = [-2] * len(_LINEBREAK_ACTIONS)
 
-    PDF text extraction often produces patterns like ``man- agement`` or ``Mag- netic``
-    where a word was hyphenated at line end. This joins them back: ``management``, ``Magnetic``.
+    def _repl(match: re.Match[str]) -> Optional[str]:
+        return _LINEBREAK_ACTIONS[match.lastindex](match, ends)
+
+    return _splice(_LINEBREAK_SPLIT_RE, _repl, text)
 
-    Only matches when:
-    - Left part has 2+ word chars (avoids single-letter cases)
-    - Right part starts lowercase with 2+ chars (indicates continuation, not new word)
-    """
-    def _repl(match: re.Match[str]) -> str:
-        left, right = match.group(1), match.group(2)
-        return f"{left}{right}"
 
-    return _HYPHEN_SPACE_CONTINUATION_RE.sub(_repl, text)
+def _fix_ligature_spacing(text: str) -> str:
+    """
+    Collapse excessive intra-word spacing often seen around ligatures.
+    """
+    return _LIGATURE_SPACING_RE.sub(r"\1\2", text)
 
 
 def _fix_single_space_splits(text: str) -> str:
@@ -219,52 +293,73 @@ def _fix_single_space_splits(text: str) -> str:
     # Process word by word to handle cases like "defi nition" where both parts are lowercase
     # First apply the standard regex for patterns like "Com pany", "Se nior"
     max_iterations = 5
-    result = text
-
-    for _ in range(max_iterations):
-        new_result = _SINGLE_SPACE_SPLIT_RE.sub(_single_space_repl, result)
-        if new_result == result:
-            break
-        result = new_result
+    first_start = -1
+    last_end = 0
+    merges = 0
+
+    def _repl(match: re.Match[str]) -> Optional[str]:
+        nonlocal first_start, last_end, merges
+        replacement = _single_space_repl(match)
+        if replacement is not None:
+            if first_start < 0:
+                first_start = match.start()
+            merges += 1
+            # Each merge drops one space, so shift into result coordinates
+            last_end = match.end() - merges
+        return replacement
+
+    result = _splice(_SINGLE_SPACE_SPLIT_RE, _repl, text)
+
+    # "Man ag er" needs further passes, but only the chains touched by a
+    # merge can change: text before the first merge scans identically and
+    # the chain holding the last merge ends at the next chain break.  Rescan
+    # just that window instead of the whole text on every iteration.
+    if merges:
+        chain_break = _SPLIT_CHAIN_BREAK_RE.search(result, last_end)
+        window_end = chain_break.end() if chain_break else len(result)
+        window = result[first_start:window_end]
+        for _ in range(max_iterations - 1):
+            new_window = _splice(_SINGLE_SPACE_SPLIT_RE, _single_space_repl, window)
+            if new_window is window:
+                break
+            window = new_window
+        result = result[:first_start] + window + result[window_end:]
 
     # Second pass: handle consecutive lowercase word fragments like "defi nition"
     # These are missed by the first pass because the regex matches greedily from left
-    words = result.split(' ')
-    merged_words = []
-    i = 0
-    while i < len(words):
-        word = words[i]
-        # Check if this word + next word should be joined
-        if i + 1 < len(words):
-            next_word = words[i + 1]
-            if next_word:
-                # Strip trailing punctuation and digits for pattern matching
-                # e.g., "ect." -> "ect", "c2" -> "c" for pattern check, but keep original in result
-                next_word_stripped = next_word.rstrip('.,;:!?\'\")\d0123456789')
-                # Check if next_word is a kerning fragment that should be joined
-                if next_word_stripped and _KERNING_FRAGMENT_PATTERNS.match(next_word_stripped):
-                    # Check if word ends with letters (not punctuation) and next_word starts lowercase
-                    if word and word[-1].isalpha() and next_word[0].islower():
-                        # Join them (keep original punctuation)
-                        merged_words.append(word + next_word)
-                        i += 2
-                        continue
-        merged_words.append(word)
-        i += 1
-
-    return ' '.join(merged_words)
-
-
-def _single_space_repl(match: re.Match[str]) -> str:
-    """Replacement function for single-space word split patterns."""
+    merged_end = -1
+
+    def _repl(match: re.Match[str]) -> Optional[str]:
+        nonlocal merged_end
+        word, next_word = match.group(1), match.group(2)
+        # A token already joined onto its left neighbour cannot start a new pair
+        if match.start() == merged_end:
+            return None
+        # Strip trailing punctuation and digits for pattern matching
+        # e.g., "ect." -> "ect", "c2" -> "c" for pattern check, but keep original in result
+        next_word_stripped = next_word.rstrip(_FRAGMENT_TRAILING_CHARS)
+        # Join when next_word is a kerning fragment, word ends with a letter
+        # (not punctuation) and next_word starts lowercase (keep original punctuation)
+        if (next_word_stripped and _is_kerning_fragment(next_word_stripped)
+                and word[-1].isalpha() and next_word[0].islower()):
+            merged_end = match.end()
+            return word
+        return None
+
+    return _splice(_KERNING_PAIR_RE, _repl, result)
+
+
+def _single_space_repl(match: re.Match[str]) -> Optional[str]:
+    """Replacement function for single-space word split patterns (None keeps the match)."""
     left, right = match.group(1), match.group(2)
 
     # Check if right part looks like a word fragment (not a standalone word)
-    if _KERNING_FRAGMENT_PATTERNS.match(right):
+    # (``right`` is already lowercase ASCII, so a plain set lookup suffices)
+    if right in _KERNING_FRAGMENTS:
         return f"{left}{right}"
 
     # Keep space for legitimate word pairs
-    return match.group(0)
+    return None
 
 
 def _fix_direct_hyphenation(text: str) -> str:
@@ -278,68 +373,78 @@ def _fix_direct_hyphenation(text: str) -> str:
     - Only remove hyphens where the right part matches known word-fragment patterns
     - This preserves legitimate compound words while fixing PDF extraction artifacts
     """
-    # Pattern to find word-hyphen-word sequences
-    # Matches: "elec-tromagnetic", "in-cluding", "MRI-re-lated"
-    pattern = re.compile(r"(\w+)-([a-z]{2,})")
-
-    def _repl(match: re.Match[str]) -> str:
+    def _repl(match: re.Match[str]) -> Optional[str]:
         left, right = match.group(1), match.group(2)
         # Only join if right part looks like a word fragment (not a standalone word)
-        if _FRAGMENT_SUFFIX_PATTERNS.match(right):
+        if right in _FRAGMENT_SUFFIXES:
             return f"{left}{right}"
         # Keep hyphen for legitimate compound words
-        return match.group(0)
+        return None
 
-    return pattern.sub(_repl, text)
+    return _splice(_DIRECT_HYPHEN_SPLIT_RE, _repl, text)
 
 
 def fix_word_splits_enhanced(text: str) -> str:
     """
     Best-effort normalisation for PDF derived text.
 
-    The function intentionally performs several small passes rather than
-    a monolithic regex so that each transformation stays easy to reason
-    about and can be tuned independently.
+    The line-break and flattened-hyphen joins share one alternation regex
+    (_LINEBREAK_SPLIT_RE), dispatched per match through the
+    _LINEBREAK_ACTIONS table by match.lastindex; direct hyphenation,
+    kerning splits, ligature spacing and whitespace cleanup remain
+    separate passes that can be tuned independently.
     """
     if not text:
         return text
 
-    # Check if any processing is needed
-    # Include direct hyphenation check for patterns like "elec-tromagnetic"
-    # Include single-space split check for patterns like "Com pany", "Se nior"
+    # Check if any processing is needed.  A single space already covers the
+    # "  " and "- " cases, so at most three memchr-backed scans run, and the
+    # direct-hyphenation regex ("elec-tromagnetic") only when a hyphen exists.
     needs_processing = (
+        " " in text or  # Kerning splits, multi-space runs, "word- continuation"
         "\n" in text or
-        "  " in text or
-        "- " in text or
-        " " in text or  # Check for single spaces (for kerning splits)
-        _DIRECT_HYPHEN_RE.search(text) is not None
+        ("-" in text and _DIRECT_HYPHEN_RE.search(text) is not None)
     )
     if not needs_processing:
         return text
 
+    # Short strings (running headers, captions, boilerplate) repeat across a
+    # document, so they go through a bounded memo; long bodies skip it.
+    if len(text) < _CACHE_MAX_LEN:
+        return _clean_word_splits_cached(text)
+    return _clean_word_splits(text)
+
+
+def _clean_word_splits(text: str) -> str:
+    """Run every cleanup pass on text (fix_word_splits_enhanced without the pre-check)."""
     cleaned = text
-    cleaned = _fix_hyphenated_linebreaks(cleaned)
-    cleaned = _fix_soft_linebreaks(cleaned)
-    cleaned = _fix_flattened_hyphenation(cleaned)  # Fix "word- continuation" patterns
+    cleaned = _fix_linebreak_splits(cleaned)  # Fix "word-\n", "word\n", "word- continuation"
     cleaned = _fix_direct_hyphenation(cleaned)  # Fix "word-continuation" patterns (no space)
     cleaned = _fix_single_space_splits(cleaned)  # Fix "Com pany", "Se nior" kerning splits
     cleaned = _fix_ligature_spacing(cleaned)
 
     # Collapse remaining multi-spaces but preserve intentional indentation by
-    # leaving leading whitespace per line untouched.
-    def _collapse(multispace_match: re.Match[str]) -> str:
-        return " "
+    # leaving leading whitespace per line untouched.  Every run of two or more
+    # spaces/tabs contains "  " or a tab, so text without either skips the scan.
+    if "  " in cleaned or "\t" in cleaned:
+        cleaned = _MULTISPACE_RE.sub(" ", cleaned)
 
-    cleaned = _MULTISPACE_RE.sub(_collapse, cleaned)
+    # The remaining two steps only touch line breaks.
+    if "\n" in cleaned:
+        # Normalise ``-\n`` patterns that may remain after other substitutions.
+        cleaned = cleaned.replace("-\n", "-")
 
-    # Normalise ``-\n`` patterns that may remain after other substitutions.
-    cleaned = cleaned.replace("-\n", "-")
-
-    # Finally collapse residual line breaks that split mid-word (but retain
-    # truly blank lines).
-    cleaned = re.sub(r"(\S)\n(\S)", r"\1 \2", cleaned)
+        # Finally collapse residual line breaks that split mid-word (but retain
+        # truly blank lines).
+        cleaned = _MIDWORD_NEWLINE_RE.sub(r"\1 \2", cleaned)
 
     return cleaned
 
 
+# Inputs shorter than this are memoised; the cleaner is pure, so a cached
+# result is always identical to a fresh run.
+_CACHE_MAX_LEN = 256
+_clean_word_splits_cached = lru_cache(maxsize=4096)(_clean_word_splits)
+
+
 __all__ = ["fix_word_splits_enhanced"]
@@ -4,25 +4,38 @@ Helper script to launch the RittDoc Editor with automatic path detection
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
 def find_files():
     """Auto-detect PDF, XML, and multimedia folders in workspace"""
-    workspace = Path('.')
+    pdfs, unified_xmls, xmls = [], [], []
+    multimedia, multimedia_lower = [], []
     
-    # Find PDF files
-    pdfs = list(workspace.glob('*.pdf'))
+    # One directory scan, classified the same way the glob patterns were:
+    # *.pdf, *unified*.xml / *.xml, *MultiMedia* / *multimedia*
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith('.pdf'):
+                pdfs.append(Path(name))
+            elif name.endswith('.xml'):
+                xmls.append(Path(name))
+                if 'unified' in name[:-4]:
+                    unified_xmls.append(Path(name))
+            if 'MultiMedia' in name:
+                multimedia.append(Path(name))
+            if 'multimedia' in name:
+                multimedia_lower.append(Path(name))
     
-    # Find unified XML files
-    xmls = list(workspace.glob('*unified*.xml'))
-    if not xmls:
-        xmls = list(workspace.glob('*.xml'))
+    # Prefer unified XML files, then any XML
+    if unified_xmls:
+        xmls = unified_xmls
     
-    # Find MultiMedia folders
-    multimedia = list(workspace.glob('*MultiMedia*'))
+    # Prefer MultiMedia folders, then lowercase multimedia
     if not multimedia:
-        multimedia = list(workspace.glob('*multimedia*'))
+        multimedia = multimedia_lower
     
     return pdfs, xmls, multimedia
 
@@ -20,14 +20,14 @@ Requirements:
 """
 
 import argparse
-import asyncio
-import json
+import importlib.util
 import logging
 import os
+import re
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 # Setup logging before imports
 logging.basicConfig(
@@ -38,63 +38,176 @@ logging.basicConfig(
 logger = logging.getLogger("orchestrator")
 
 
+# Required Python packages: (name reported when missing, top-level module)
+_PACKAGE_PROBES = [
+    ("pdf2image", "pdf2image"),
+    ("PyMuPDF", "fitz"),
+    ("openai", "openai"),
+    ("pypandoc", "pypandoc"),
+    ("Pillow", "PIL"),
+]
+
+# Required system tools: (name reported when missing, executable on PATH)
+_SYSTEM_PROBES = [
+    ("poppler-utils (system package)", "pdftoppm"),
+    ("pandoc (system package)", "pandoc"),
+]
+
+
 def check_dependencies() -> List[str]:
-    """Check for required dependencies and return list of missing ones."""
+    """
+    Check for required dependencies and return list of missing ones.
+
+    Packages are located with importlib.util.find_spec, which only asks the
+    import finders where the module lives; no package code is executed and
+    nothing is left behind in sys.modules.
+
+    pdftoppm is always required: whether the service can render with
+    pypdfium2 instead is only known once it is imported for a conversion.
+    """
+    import shutil
+
     missing = []
 
     # Python packages
-    try:
-        import pdf2image
-    except ImportError:
-        missing.append("pdf2image")
+    for name, module in _PACKAGE_PROBES:
+        if importlib.util.find_spec(module) is None:
+            missing.append(name)
 
-    try:
-        import fitz
-    except ImportError:
-        missing.append("PyMuPDF")
+    # System dependencies
+    for name, exe in _SYSTEM_PROBES:
+        if not shutil.which(exe):
+            missing.append(name)
 
-    try:
-        import openai
-    except ImportError:
-        missing.append("openai")
+    return missing
 
-    try:
-        import pypandoc
-    except ImportError:
-        missing.append("pypandoc")
 
-    try:
-        from PIL import Image
-    except ImportError:
-        missing.append("Pillow")
+# A passing dependency check is remembered here until the interpreter, the
+# installed packages (site-packages mtime), PATH or the resolved system
+# tools change
+DEPS_CACHE_DIR = Path.home() / ".cache" / "pdf2xml"
 
-    # System dependencies
+# Per-page Vision API responses for --resume, one {sha256(page image)}.json each
+VISION_CACHE_DIR = DEPS_CACHE_DIR / "vision"
+
+
+def _deps_cache_path() -> Optional[Path]:
+    """
+    Cache file for the current environment, or None if it can't be keyed.
+
+    The key includes where each system tool resolves, so uninstalling one
+    (PATH unchanged) misses the cache and is reported by the next probe.
+    """
+    import hashlib
     import shutil
-    if not shutil.which("pdftoppm"):
-        missing.append("poppler-utils (system package)")
+    import sysconfig
+
+    try:
+        site_mtime = os.path.getmtime(sysconfig.get_paths()["purelib"])
+    except (KeyError, OSError):
+        return None
+
+    key = hashlib.sha1(
+        "|".join([sys.executable, sys.version, str(site_mtime),
+                  os.environ.get("PATH", ""),
+                  *(str(shutil.which(exe)) for _, exe in _SYSTEM_PROBES)]).encode()
+    ).hexdigest()
+    return DEPS_CACHE_DIR / f"deps-{key}.json"
+
 
-    if not shutil.which("pandoc"):
-        missing.append("pandoc (system package)")
+def check_dependencies_cached(refresh: bool = False) -> List[str]:
+    """
+    check_dependencies() that skips probing when this environment already passed.
+
+    Only a clean result is cached, so a missing dependency is re-checked on
+    every run until it is installed.
+
+    Args:
+        refresh: Always probe (and update the cache on success)
+    """
+    cache_path = _deps_cache_path()
+    if cache_path is not None and not refresh and cache_path.exists():
+        logger.debug(f"Dependency check cached: {cache_path}")
+        return []
+
+    missing = check_dependencies()
+
+    if cache_path is not None and not missing:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text("[]")
+        except OSError as e:
+            logger.debug(f"Could not write dependency cache: {e}")
 
     return missing
 
 
-def parse_page_numbers(pages_str: str) -> Optional[List[int]]:
+# Selected pages: a range for contiguous selections, else a sorted list
+PageNumbers = Union[range, List[int]]
+
+# "1,3,5-10,15": comma-separated pages and start-end ranges
+_PAGE_TOKEN_RE = re.compile(r"([0-9]+)(?:-([0-9]+))?")
+_PAGE_SPEC_RE = re.compile(r"[0-9]+(?:-[0-9]+)?(?:,[0-9]+(?:-[0-9]+)?)*")
+
+
+def parse_page_numbers(pages_str: str) -> Optional[PageNumbers]:
     """
-    Parse page number string into a list of integers.
+    Parse page number string into sorted, de-duplicated page numbers.
 
     Supports:
         - Single pages: "1,2,3"
         - Ranges: "1-5"
         - Mixed: "1,3,5-10,15"
 
+    Contiguous selections ("1-100000", "1-5,6-9") come back as a range, so
+    whole-document conversions don't materialise a list of every page;
+    anything else is a sorted list.
+
     Returns None if empty (meaning all pages).
     """
     if not pages_str or pages_str.lower() == "all":
         return None
 
+    compact = pages_str.replace(" ", "")
+
+    # Common cases: one page ("7") or one range ("1-500"), already sorted
+    single = _PAGE_TOKEN_RE.fullmatch(compact)
+    if single:
+        start = int(single.group(1))
+        end = int(single.group(2)) if single.group(2) else start
+        return range(start, end + 1) or None
+
+    # Well-formed specs: tokenise in one regex pass and merge the sorted
+    # ranges, so "1-100000" never builds (and sorts) a set of every page
+    if _PAGE_SPEC_RE.fullmatch(compact):
+        spans = sorted(
+            (int(start), int(end) if end else int(start))
+            for start, end in _PAGE_TOKEN_RE.findall(compact)
+        )
+        # Merge overlapping/adjacent spans (empty "5-3" spans drop out)
+        merged: List[List[int]] = []
+        for start, end in spans:
+            if start > end:
+                continue
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        if not merged:
+            return None
+        if len(merged) == 1:
+            return range(merged[0][0], merged[0][1] + 1)
+
+        result: List[int] = []
+        for start, end in merged:
+            result.extend(range(start, end + 1))
+        return result
+
+    # Anything else goes through the part-by-part parser, which warns about
+    # the invalid parts and keeps the valid ones
     pages = set()
-    parts = pages_str.replace(" ", "").split(",")
+    parts = compact.split(",")
 
     for part in parts:
         if "-" in part:
@@ -115,20 +228,101 @@ def parse_page_numbers(pages_str: str) -> Optional[List[int]]:
     return sorted(pages) if pages else None
 
 
+def describe_pages(page_numbers: Optional[PageNumbers]) -> str:
+    """Human-readable page selection for the banner ("All", "1-500", "[1, 3, 5]")."""
+    if not page_numbers:
+        return "All"
+    if isinstance(page_numbers, range) and len(page_numbers) > 1:
+        return f"{page_numbers.start}-{page_numbers.stop - 1}"
+    return str(list(page_numbers))
+
+
+def select_render_backend() -> str:
+    """
+    Pick the page rasteriser for the service: pypdfium2 > PyMuPDF > pdf2image.
+
+    pypdfium2 is the fastest and ships as a plain wheel (no poppler needed);
+    PyMuPDF also renders in-process; pdf2image forks pdftoppm per page.
+
+    Returns:
+        'pypdfium2', 'pymupdf' or 'pdf2image'
+    """
+    if importlib.util.find_spec("pypdfium2") is not None:
+        return "pypdfium2"
+    if importlib.util.find_spec("fitz") is not None:
+        return "pymupdf"
+    return "pdf2image"
+
+
+def service_accepts_render_backend(service_cls) -> bool:
+    """
+    True when service_cls takes a render_backend argument.
+
+    Services without it choose their own rasteriser (pdf2image, i.e.
+    pdftoppm), so select_render_backend() only applies to services that do.
+    """
+    import inspect
+
+    return "render_backend" in inspect.signature(service_cls).parameters
+
+
+class UnsupportedOptionError(RuntimeError):
+    """An option was set that the installed conversion service does not accept."""
+
+
+def supported_kwargs(func, **options) -> dict:
+    """
+    Return the options that were set (not None), checked against func's signature.
+
+    Unset options are not forwarded, so the service keeps its own defaults.
+    An option the user set but func does not accept raises
+    UnsupportedOptionError instead of being silently dropped.
+    """
+    import inspect
+
+    requested = {name: value for name, value in options.items() if value is not None}
+    params = inspect.signature(func).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return requested
+
+    unsupported = [name for name in requested if name not in params]
+    if unsupported:
+        raise UnsupportedOptionError(
+            f"{getattr(func, '__qualname__', func)} does not support: {', '.join(unsupported)}"
+        )
+    return requested
+
+
 async def run_conversion(
     pdf_path: str,
-    page_numbers: Optional[List[int]],
+    page_numbers: Optional[PageNumbers],
     openai_api_key: str,
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    resume: bool = False,
+    dpi: Optional[int] = None,
+    grayscale: Optional[bool] = None,
+    batch_size: Optional[int] = None
 ) -> dict:
     """
     Run the AI-powered PDF conversion.
 
     Args:
         pdf_path: Path to the input PDF
-        page_numbers: List of page numbers to convert (None = all)
+        page_numbers: Page numbers to convert, as a range or sorted list
+            (None = all); passed through as-is, never expanded
         openai_api_key: OpenAI API key
         output_dir: Output directory (defaults to PDF's directory)
+        concurrency: Maximum number of Vision API requests in flight (None =
+            the service's default)
+        resume: Reuse per-page Vision results cached under VISION_CACHE_DIR
+            (keyed by the SHA-256 of the rendered page image) and cache new ones
+        dpi: Page rendering resolution sent to the Vision API (None = the
+            service's default)
+        grayscale: Render pages as grayscale instead of RGB (None = the
+            service's default)
+        batch_size: Page images sent per Vision API request (1 = one page
+            per request; None = the service's default)
 
     Returns:
         Conversion metadata dict
@@ -136,15 +330,38 @@ async def run_conversion(
     # Import the service (after setting up the API key)
     from app.services.ai_pdf_conversion_service import AIPDFConversionService
 
-    # Create service instance with API key
-    service = AIPDFConversionService(openai_api_key=openai_api_key)
+    # Create service instance with API key; in-flight page requests are
+    # bounded (asyncio.Semaphore in the service) to stay under rate limits.
+    service_options = supported_kwargs(
+        AIPDFConversionService,
+        concurrency=concurrency,
+        dpi=dpi,
+        grayscale=grayscale,
+        batch_size=batch_size
+    )
+    # The rasteriser is a hint rather than a user option: it is only passed
+    # to a service that names render_backend in its signature
+    if service_accepts_render_backend(AIPDFConversionService):
+        service_options["render_backend"] = select_render_backend()
+    service = AIPDFConversionService(openai_api_key=openai_api_key, **service_options)
+
+    # Page-result caching is only requested when resuming; a service without
+    # it raises UnsupportedOptionError instead of re-sending every page
+    cache_options = supported_kwargs(
+        service.convert_pdf_to_docx_local,
+        resume=resume or None,
+        vision_cache_dir=str(VISION_CACHE_DIR) if resume else None
+    )
+    if cache_options:
+        VISION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     # Run conversion
     success, error_msg, metadata = await service.convert_pdf_to_docx_local(
         pdf_path=pdf_path,
         output_dir=output_dir,
         page_numbers=page_numbers,
-        run_qc=False  # Skip QC as requested
+        run_qc=False,  # Skip QC as requested
+        **cache_options
     )
 
     if not success:
@@ -153,6 +370,63 @@ async def run_conversion(
     return metadata
 
 
+def print_block(header: List[str], body: List[str], footer: List[str]) -> None:
+    """Print a banner (header, body, footer lines) with a single write and flush."""
+    sys.stdout.write("\n".join(header + body + footer) + "\n")
+    sys.stdout.flush()
+
+
+def run_async(coro):
+    """
+    Run coro to completion on a fresh event loop.
+
+    The per-page Vision requests are many small network round-trips, which
+    uvloop's libuv-based loop schedules with much less per-callback overhead
+    than the default selector loop, so it is used when installed.
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    logger.debug("Using uvloop event loop")
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+def write_metadata(metadata: dict, metadata_path: Path) -> None:
+    """
+    Write the conversion metadata as indented JSON.
+
+    Uses orjson when it is installed (serialisation in C); otherwise the
+    stdlib json module.  Either way values JSON can't represent (datetimes,
+    paths, ...) are written as str(value).
+    """
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        with open(metadata_path, 'wb') as f:
+            f.write(orjson.dumps(
+                metadata,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ))
+        return
+
+    import json
+    with open(metadata_path, 'w') as f:
+        json.dump(metadata, f, indent=2, default=str)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -208,6 +482,41 @@ Output files (in same directory as input PDF by default):
         help="Output directory. Default: same directory as input PDF"
     )
 
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=None,
+        help="Maximum concurrent Vision API requests. Default: the service's own limit"
+    )
+
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=None,
+        help="Page rendering resolution for the Vision API (text recognition gains "
+             "little above ~100-150). Default: the service's own resolution"
+    )
+
+    parser.add_argument(
+        "--grayscale",
+        action="store_true",
+        default=None,
+        help="Render pages in grayscale (smaller uploads, fewer image tokens)"
+    )
+
+    parser.add_argument(
+        "--batch-size", "-b",
+        type=int,
+        default=None,
+        help="Pages per Vision API request. Default: the service's own batching"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Reuse cached per-page Vision results from earlier runs ({VISION_CACHE_DIR})"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -226,8 +535,8 @@ Output files (in same directory as input PDF by default):
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Check dependencies
-    missing = check_dependencies()
+    # Check dependencies (--check-deps always probes afresh)
+    missing = check_dependencies_cached(refresh=args.check_deps)
     if args.check_deps:
         if missing:
             print("Missing dependencies:")
@@ -259,6 +568,20 @@ Output files (in same directory as input PDF by default):
         print(f"ERROR: File does not appear to be a PDF: {pdf_path}")
         sys.exit(1)
 
+    # The suffix is only a cheap first filter; a misnamed file would
+    # otherwise fail deep in the pipeline after API calls were paid for
+    try:
+        with open(pdf_path, 'rb') as f:
+            header = f.read(1024)
+    except OSError as e:
+        print(f"ERROR: Cannot read PDF file: {pdf_path} ({e})")
+        sys.exit(1)
+
+    # Readers (and PyMuPDF) accept the header anywhere in the first 1 KiB
+    if b"%PDF-" not in header:
+        print(f"ERROR: File is not a PDF (missing %PDF- header): {pdf_path}")
+        sys.exit(1)
+
     # Get OpenAI API key
     openai_key = args.openai_key or os.environ.get("OPENAI_API_KEY")
     if not openai_key:
@@ -266,61 +589,93 @@ Output files (in same directory as input PDF by default):
         print("  Set via --openai-key argument or OPENAI_API_KEY environment variable")
         sys.exit(1)
 
+    if args.concurrency is not None and args.concurrency < 1:
+        print(f"ERROR: --concurrency must be at least 1 (got {args.concurrency})")
+        sys.exit(1)
+
+    if args.batch_size is not None and args.batch_size < 1:
+        print(f"ERROR: --batch-size must be at least 1 (got {args.batch_size})")
+        sys.exit(1)
+
+    if args.dpi is not None and args.dpi < 1:
+        print(f"ERROR: --dpi must be at least 1 (got {args.dpi})")
+        sys.exit(1)
+
     # Parse page numbers
     page_numbers = parse_page_numbers(args.pages) if args.pages else None
 
     # Print conversion info
-    print("=" * 60)
-    print("PDF to DOCX/XML Converter (AI-Powered)")
-    print("=" * 60)
-    print(f"Input PDF:    {pdf_path}")
-    print(f"Pages:        {page_numbers if page_numbers else 'All'}")
-    print(f"Output Dir:   {args.output_dir or pdf_path.parent}")
-    print("=" * 60)
-
-    # Run conversion
-    start_time = datetime.now()
+    info = [
+        f"Input PDF:    {pdf_path}",
+        f"Pages:        {describe_pages(page_numbers)}",
+        f"Output Dir:   {args.output_dir or pdf_path.parent}",
+    ]
+    if args.dpi is not None:
+        info.append(f"DPI:          {args.dpi}")
+    if args.grayscale:
+        info.append("Color:        grayscale")
+    print_block(["=" * 60, "PDF to DOCX/XML Converter (AI-Powered)", "=" * 60], info, ["=" * 60])
+
+    # Run conversion (timed on the monotonic clock, immune to NTP steps)
+    start_ns = time.perf_counter_ns()
     try:
-        metadata = asyncio.run(run_conversion(
+        metadata = run_async(run_conversion(
             pdf_path=str(pdf_path),
             page_numbers=page_numbers,
             openai_api_key=openai_key,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            concurrency=args.concurrency,
+            resume=args.resume,
+            dpi=args.dpi,
+            grayscale=args.grayscale,
+            batch_size=args.batch_size
         ))
 
-        duration = (datetime.now() - start_time).total_seconds()
-
-        print("\n" + "=" * 60)
-        print("CONVERSION COMPLETED SUCCESSFULLY")
-        print("=" * 60)
-        print(f"Duration:     {duration:.1f} seconds")
-        print(f"Pages:        {metadata.get('pages_converted', 'N/A')}")
-        print(f"Confidence:   {metadata.get('average_confidence_score', 'N/A')}%")
-        print("-" * 60)
-        print("Output Files:")
-        print(f"  DOCX:       {metadata.get('output_docx', 'N/A')}")
-        print(f"  XML:        {metadata.get('output_xml', 'N/A')}")
-        print(f"  Markdown:   {metadata.get('output_markdown', 'N/A')}")
-        print("=" * 60)
-
-        # Save metadata to JSON
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+
+        # Save metadata to JSON on a worker thread so the summary below is
+        # printed while the file is written
+        from concurrent.futures import ThreadPoolExecutor
+
         metadata_path = Path(metadata.get('output_docx', '')).with_suffix('.metadata.json')
-        if metadata_path:
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2, default=str)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            write_future = pool.submit(write_metadata, metadata, metadata_path)
+
+            print_block(
+                ["", "=" * 60, "CONVERSION COMPLETED SUCCESSFULLY", "=" * 60],
+                [
+                    f"Duration:     {duration:.1f} seconds",
+                    f"Pages:        {metadata.get('pages_converted', 'N/A')}",
+                    f"Confidence:   {metadata.get('average_confidence_score', 'N/A')}%",
+                    "-" * 60,
+                    "Output Files:",
+                    f"  DOCX:       {metadata.get('output_docx', 'N/A')}",
+                    f"  XML:        {metadata.get('output_xml', 'N/A')}",
+                    f"  Markdown:   {metadata.get('output_markdown', 'N/A')}",
+                ],
+                ["=" * 60],
+            )
+
+            write_future.result()
             print(f"\nMetadata saved to: {metadata_path}")
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print("\n" + "=" * 60)
-        print("CONVERSION FAILED")
-        print("=" * 60)
-        print(f"Duration:     {duration:.1f} seconds")
-        print(f"Error:        {str(e)}")
-        print("=" * 60)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        print_block(
+            ["", "=" * 60, "CONVERSION FAILED", "=" * 60],
+            [
+                f"Duration:     {duration:.1f} seconds",
+                f"Error:        {str(e)}",
+            ],
+            ["=" * 60],
+        )
         logger.exception("Conversion failed")
         sys.exit(1)
 
 
 if __name__ == "__main__":
+    # ORCHESTRATOR_IMPORTTIME=1 re-runs this script under -X importtime so
+    # start-up import costs can be profiled (report goes to stderr)
+    if os.environ.get("ORCHESTRATOR_IMPORTTIME") == "1" and "importtime" not in sys._xoptions:
+        os.execv(sys.executable, [sys.executable, "-X", "importtime"] + sys.argv)
     main()
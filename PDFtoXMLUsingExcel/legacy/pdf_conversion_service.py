@@ -7,15 +7,20 @@ It includes comprehensive error handling, temporary file management, and convers
 Supports both S3-based and local file operations.
 """
 
+import io
 import logging
+import multiprocessing
 import os
+import re
 import tempfile
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from pdf2docx import Converter
 import fitz  # PyMuPDF for PDF validation
@@ -60,16 +65,206 @@ class ConversionQuality:
     STANDARD = "standard"
     HIGH = "high"
 
+# Read size when streaming S3 downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Page limit for conversions
+MAX_PAGES = 100
+
+# Size limit for source PDFs; downloads are rejected before buffering past it
+MAX_FILE_SIZE_MB = 50
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+
+# Linearized PDFs declare their page count (/N) in a dictionary within the
+# first KiB of the file, so oversized documents can be rejected mid-download
+_LINEARIZED_HEADER_SIZE = 1024
+_LINEARIZED_PAGES_RE = re.compile(rb"/Linearized\b[^>]*?/N\s+(\d+)")
+
+# Validation results kept for unchanged local PDFs
+VALIDATION_CACHE_SIZE = 512
+
+# Presigned download URLs are reused for half of the expiry s3_service signs
+# them with (settings.S3_PRESIGNED_URL_EXPIRATION, else boto3's one hour), so
+# a cached URL always has time left for the download itself
+DEFAULT_PRESIGNED_URL_EXPIRY_SECONDS = 3600
+PRESIGNED_URL_CACHE_SIZE = 1024
+
+# Threads for PDF validation (and conversion when no process pool)
+THREAD_POOL_WORKERS = 2
+
+# Threads for S3 uploads, QC and temp-file cleanup
+IO_WORKERS = 4
+
+# RAM-backed temp storage on Linux; PDFs and DOCX outputs here never hit disk.
+# Opt-in only: /dev/shm is small in containers (64 MB by default under Docker)
+TMPFS_DIR = Path("/dev/shm")
+
+
+def _convert_pdf_to_docx_worker(
+    pdf_path: str,
+    docx_path: str,
+    quality: str,
+    include_metadata: bool,
+    page_range: Optional[List[int]] = None
+) -> Dict[str, Any]:
+    """
+    PDF to DOCX conversion using pdf2docx.
+
+    Module-level and string-argument only so it can run in a process pool:
+    the Converter is constructed inside the worker rather than pickled.
+    page_range is a [start, end) pair of 0-based pages; None converts all.
+    """
+    start, end = page_range or (0, None)
+    conversion_start = time.perf_counter()
+    
+    try:
+        # Configure conversion parameters based on quality
+        if quality == ConversionQuality.HIGH:
+            # High quality settings
+            converter_params = {
+                "start": start,  # Start page
+                "end": end,  # End page, exclusive (None = all pages)
+                "pages": None,  # Specific pages (None = all pages)
+                "password": None,  # PDF password
+                "multi_processing": False,  # Disable for stability
+                "cpu_count": 1,  # Single CPU for stability
+                "ignore_page_error": True,  # Skip a broken page, keep the rest
+                "parse_stream_table": True,  # Detect borderless tables
+                "min_section_height": 10.0,  # Finer section/column detection
+                "connected_border_tolerance": 0.25,  # Tighter table border joins
+            }
+        else:
+            # Standard quality settings (faster)
+            converter_params = {
+                "start": start,
+                "end": end,
+                "pages": None,
+                "password": None,
+                "multi_processing": False,
+                "cpu_count": 1,
+                "ignore_page_error": True,
+                "parse_stream_table": False,  # Only tables with drawn borders
+                "min_section_height": 20.0,
+                "connected_border_tolerance": 0.5,
+            }
+        
+        # Perform conversion
+        converter = Converter(pdf_path)
+        converter.convert(docx_path, **converter_params)
+        converter.close()
+        
+        conversion_duration = time.perf_counter() - conversion_start
+        
+        # Get output file size
+        output_size = os.path.getsize(docx_path)
+        output_size_mb = output_size / (1024 * 1024)
+        
+        return {
+            "conversion_duration_seconds": conversion_duration,
+            "output_size_bytes": output_size,
+            "output_size_mb": output_size_mb,
+            "quality": quality,
+            "include_metadata": include_metadata,
+            "converter_params": converter_params
+        }
+        
+    except Exception as e:
+        raise ConversionError(f"pdf2docx conversion failed: {str(e)}") from e
+
+
+def _describe_validated_pdf(pdf_info: Dict[str, Any]) -> str:
+    """
+    Page count and size for the validation log line.
+
+    When blank leading/trailing pages are trimmed, the converted 1-based page
+    range is included so a shorter DOCX can be explained.
+    """
+    summary = f"{pdf_info['pages']} pages, {pdf_info['size_mb']:.2f} MB"
+    page_range = pdf_info.get("content_page_range")
+    if page_range:
+        summary += (f"; converting pages {page_range[0] + 1}-{page_range[1]}"
+                    f" ({pdf_info['pages_to_convert']} pages, blank edges skipped)")
+    return summary
+
+
+def _make_docx_key(filename: str, conversion_id: str) -> str:
+    """
+    S3 key for a converted DOCX: converted/<conversion_id>-<name>.docx.
+
+    A trailing .pdf or .docx extension on filename is replaced; any other
+    name is kept whole.
+    """
+    stem, ext = os.path.splitext(filename)
+    if ext.lower() not in (".pdf", ".docx"):
+        stem = filename
+    return f"converted/{conversion_id}-{stem}.docx"
+
+
 class PDFConversionService:
     """Service for converting PDF files to Word documents."""
 
-    def __init__(self):
-        """Initialize the PDF conversion service."""
-        self.temp_dir = Path(tempfile.gettempdir()) / "manuscript_processor"
+    def __init__(
+        self,
+        use_process_pool: Optional[bool] = None,
+        use_tmpfs: Optional[bool] = None
+    ):
+        """
+        Initialize the PDF conversion service.
+
+        pdf2docx always runs single-process: its page pool writes relative
+        pages-{i}.json files into the working directory (so concurrent
+        conversions collide), ignores cpu_count, and would fork from the
+        event-loop process while its threads are live.
+
+        Args:
+            use_process_pool: Run pdf2docx conversions in a process pool instead
+                of the thread pool. Defaults to settings.PDF2DOCX_USE_PROCESS_POOL.
+            use_tmpfs: Keep conversion temp files in TMPFS_DIR (/dev/shm) when it
+                is writable. Defaults to settings.PDF2DOCX_USE_TMPFS, else off.
+        """
+        if use_tmpfs is None and HAS_APP_CONFIG:
+            use_tmpfs = getattr(settings, "PDF2DOCX_USE_TMPFS", False)
+        
+        if use_tmpfs and TMPFS_DIR.is_dir() and os.access(TMPFS_DIR, os.W_OK):
+            temp_root = TMPFS_DIR
+        else:
+            temp_root = Path(tempfile.gettempdir())
+        self.temp_dir = temp_root / "manuscript_processor"
         self.temp_dir.mkdir(exist_ok=True)
         
-        # Thread pool for CPU-intensive conversion tasks
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # Thread pool for PDF validation (and conversion when no process pool)
+        self.thread_pool_workers = THREAD_POOL_WORKERS
+        self.executor = ThreadPoolExecutor(max_workers=self.thread_pool_workers)
+        
+        # Separate pool for uploads, QC and file cleanup so they never queue
+        # behind long-running conversions on self.executor
+        self.io_pool_workers = IO_WORKERS
+        self.io_executor = ThreadPoolExecutor(max_workers=self.io_pool_workers)
+        
+        if use_process_pool is None and HAS_APP_CONFIG:
+            use_process_pool = getattr(settings, "PDF2DOCX_USE_PROCESS_POOL", False)
+        
+        # Process pool for GIL-bound pdf2docx conversions. Workers are spawned,
+        # not forked: the executor threads above may hold PyMuPDF or logging
+        # locks at fork time, which a forked child would inherit held
+        self.process_pool = None
+        self.process_pool_workers = 0
+        if use_process_pool:
+            self.process_pool_workers = min(os.cpu_count() or 1, self.thread_pool_workers)
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=self.process_pool_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        
+        # (path, st_mtime_ns, st_size, include_metadata) -> pdf_info, least recently used first
+        self._validation_cache: "OrderedDict[Tuple[str, int, int, bool], Dict[str, Any]]" = OrderedDict()
+        
+        # s3_key -> (monotonic expiry, presigned URL), oldest first
+        self._download_url_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        url_expiry = DEFAULT_PRESIGNED_URL_EXPIRY_SECONDS
+        if HAS_APP_CONFIG:
+            url_expiry = getattr(settings, "S3_PRESIGNED_URL_EXPIRATION", url_expiry)
+        self.presigned_url_ttl = url_expiry / 2
         
         logger.info(f"PDF Conversion Service initialized with temp dir: {self.temp_dir}")
 
@@ -95,18 +290,15 @@ class PDFConversionService:
         Raises:
             ConversionError: If conversion fails
         """
-        conversion_id = str(uuid.uuid4())
+        conversion_id = uuid.uuid4().hex
         start_time = datetime.utcnow()
+        start_counter = time.perf_counter()
         
         logger.info(f"Starting AI-powered PDF conversion [{conversion_id}]: {pdf_s3_key} -> {output_filename}")
         
         try:
             # Generate S3 key for output file
-            docx_s3_key = f"converted/{conversion_id}-{output_filename}"
-            if not docx_s3_key.endswith('.docx'):
-                docx_s3_key = docx_s3_key.replace('.pdf', '.docx')
-                if not docx_s3_key.endswith('.docx'):
-                    docx_s3_key += '.docx'
+            docx_s3_key = _make_docx_key(output_filename, conversion_id)
             
             # Use the AI-powered conversion service
             success, error_message, ai_metadata = await ai_pdf_conversion_service.convert_pdf_to_docx(
@@ -116,9 +308,9 @@ class PDFConversionService:
             if not success:
                 raise ConversionError(f"AI conversion failed: {error_message}")
             
-            # Calculate processing time
-            end_time = datetime.utcnow()
-            processing_time = (end_time - start_time).total_seconds()
+            # Calculate processing time (monotonic clock; wall-clock end derived from it)
+            processing_time = time.perf_counter() - start_counter
+            end_time = start_time + timedelta(seconds=processing_time)
             
             # Combine metadata in the expected format
             final_metadata = {
@@ -166,8 +358,9 @@ class PDFConversionService:
         Raises:
             ConversionError: If conversion fails
         """
-        conversion_id = str(uuid.uuid4())
+        conversion_id = uuid.uuid4().hex
         start_time = datetime.utcnow()
+        start_counter = time.perf_counter()
         
         logger.info(f"Starting PDF conversion [{conversion_id}]: {pdf_s3_key} -> {output_filename}")
         
@@ -176,13 +369,19 @@ class PDFConversionService:
         docx_temp_path = self.temp_dir / f"{conversion_id}_output.docx"
         
         try:
-            # Step 1: Download PDF from S3
+            # Step 1: Download PDF from S3 into memory
             logger.info(f"Downloading PDF from S3: {pdf_s3_key}")
-            await self._download_from_s3(pdf_s3_key, pdf_temp_path)
+            pdf_data = await self._download_from_s3(pdf_s3_key)
+            
+            # Step 2: Validate PDF from memory; only a valid PDF is written to disk
+            pdf_info = await self._validate_pdf(
+                pdf_temp_path, pdf_data=pdf_data, include_metadata=include_metadata
+            )
+            logger.info(f"PDF validation successful: {_describe_validated_pdf(pdf_info)}")
             
-            # Step 2: Validate PDF file
-            pdf_info = await self._validate_pdf(pdf_temp_path)
-            logger.info(f"PDF validation successful: {pdf_info['pages']} pages, {pdf_info['size_mb']:.2f} MB")
+            loop = asyncio.get_event_loop()
+            with pdf_data, pdf_data.getbuffer() as pdf_view:
+                await loop.run_in_executor(self.io_executor, pdf_temp_path.write_bytes, pdf_view)
             
             # Step 3: Convert PDF to DOCX
             logger.info(f"Converting PDF to DOCX with quality: {quality}")
@@ -190,29 +389,26 @@ class PDFConversionService:
                 pdf_temp_path, 
                 docx_temp_path, 
                 quality,
-                include_metadata
+                include_metadata,
+                pdf_info["content_page_range"]
             )
             
             # Step 4: QC pass - highlight additions/edits and append deletions section
             try:
-                qc_meta = qc_highlight_service.run_qc_sync(str(pdf_temp_path), str(docx_temp_path))
+                qc_meta = await self._run_qc(pdf_temp_path, docx_temp_path)
             except Exception as qc_error:
                 logger.warning(f"QC highlight failed: {qc_error}")
                 qc_meta = {"qc": {"error": str(qc_error)}}
 
             # Step 5: Upload DOCX to S3
-            docx_s3_key = f"converted/{uuid.uuid4()}-{output_filename}"
-            if not docx_s3_key.endswith('.docx'):
-                docx_s3_key = docx_s3_key.replace('.pdf', '.docx')
-                if not docx_s3_key.endswith('.docx'):
-                    docx_s3_key += '.docx'
+            docx_s3_key = _make_docx_key(output_filename, conversion_id)
             
             logger.info(f"Uploading DOCX to S3: {docx_s3_key}")
             await self._upload_to_s3(docx_temp_path, docx_s3_key)
             
             # Step 6: Prepare conversion metadata
-            end_time = datetime.utcnow()
-            conversion_duration = (end_time - start_time).total_seconds()
+            conversion_duration = time.perf_counter() - start_counter
+            end_time = start_time + timedelta(seconds=conversion_duration)
             
             metadata = {
                 "conversion_id": conversion_id,
@@ -236,57 +432,97 @@ class PDFConversionService:
             error_msg = f"PDF conversion failed [{conversion_id}]: {str(e)}"
             logger.error(error_msg, exc_info=True)
             
-            # Prepare error metadata
-            end_time = datetime.utcnow()
-            conversion_duration = (end_time - start_time).total_seconds()
-            
-            error_metadata = {
-                "conversion_id": conversion_id,
-                "source_pdf_key": pdf_s3_key,
-                "conversion_start": start_time.isoformat(),
-                "conversion_end": end_time.isoformat(),
-                "conversion_duration_seconds": conversion_duration,
-                "quality": quality,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "success": False
-            }
-            
             raise ConversionError(error_msg) from e
             
         finally:
             # Cleanup temporary files
             await self._cleanup_temp_files([pdf_temp_path, docx_temp_path])
 
-    async def _download_from_s3(self, s3_key: str, local_path: Path) -> None:
-        """Download a file from S3 to local path."""
+    async def _download_from_s3(self, s3_key: str) -> io.BytesIO:
+        """
+        Download a file from S3 into an in-memory buffer.
+
+        A 403 on a cached presigned URL (expired early, or signed with rotated
+        credentials) is retried once with a freshly generated URL.
+        """
         try:
-            # Use S3 service to download file
-            download_url = s3_service.generate_presigned_download_url(s3_key)
-            if not download_url:
-                raise ConversionError(f"Failed to generate download URL for {s3_key}")
-            
             # Download file using aiohttp or similar
             import aiohttp
             async with aiohttp.ClientSession() as session:
-                async with session.get(download_url) as response:
+                response = await session.get(self._get_download_url(s3_key))
+                if response.status == 403:
+                    response.release()
+                    self._download_url_cache.pop(s3_key, None)
+                    response = await session.get(self._get_download_url(s3_key))
+                
+                async with response:
                     if response.status != 200:
+                        self._download_url_cache.pop(s3_key, None)
                         raise ConversionError(f"Failed to download file from S3: HTTP {response.status}")
                     
-                    with open(local_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
+                    # Reject a declared oversize body before reading any of it;
+                    # the running total below catches a missing or wrong header
+                    size = response.content_length
+                    if size is not None and size > MAX_FILE_SIZE_BYTES:
+                        raise ConversionError(f"PDF is too large. Maximum allowed: {MAX_FILE_SIZE_MB} MB")
+                    
+                    buf = io.BytesIO()
+                    header = b""
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        if buf.tell() + len(chunk) > MAX_FILE_SIZE_BYTES:
+                            raise ConversionError(f"PDF is too large. Maximum allowed: {MAX_FILE_SIZE_MB} MB")
+                        buf.write(chunk)
+                        if len(header) < _LINEARIZED_HEADER_SIZE:
+                            header += chunk[:_LINEARIZED_HEADER_SIZE - len(header)]
+                            if len(header) == _LINEARIZED_HEADER_SIZE:
+                                self._check_linearized_page_count(header)
                             
-            logger.debug(f"Downloaded {s3_key} to {local_path}")
+            logger.debug(f"Downloaded {s3_key} ({buf.tell()} bytes)")
+            buf.seek(0)
+            return buf
             
         except Exception as e:
             raise ConversionError(f"Failed to download {s3_key} from S3: {str(e)}") from e
 
+    def _get_download_url(self, s3_key: str) -> str:
+        """Presigned download URL for s3_key, reused for self.presigned_url_ttl seconds."""
+        now = time.monotonic()
+        entry = self._download_url_cache.get(s3_key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        download_url = s3_service.generate_presigned_download_url(s3_key)
+        if not download_url:
+            raise ConversionError(f"Failed to generate download URL for {s3_key}")
+        
+        self._download_url_cache.pop(s3_key, None)
+        self._download_url_cache[s3_key] = (now + self.presigned_url_ttl, download_url)
+        if len(self._download_url_cache) > PRESIGNED_URL_CACHE_SIZE:
+            self._download_url_cache.popitem(last=False)
+        return download_url
+
+    def _check_linearized_page_count(self, header: bytes) -> None:
+        """
+        Reject a linearized PDF whose declared page count exceeds MAX_PAGES.
+
+        Non-linearized PDFs carry no early page count and are left to
+        _validate_pdf_sync once the download completes.
+        """
+        match = _LINEARIZED_PAGES_RE.search(header)
+        if match is None:
+            return
+        page_count = int(match.group(1))
+        if page_count > MAX_PAGES:
+            raise ConversionError(f"PDF has too many pages ({page_count}). Maximum allowed: {MAX_PAGES}")
+
     async def _upload_to_s3(self, local_path: Path, s3_key: str) -> None:
         """Upload a local file to S3."""
         try:
-            # Use S3 service to upload file
-            success = s3_service.upload_file(str(local_path), s3_key)
+            # Use S3 service to upload file, off the event loop
+            loop = asyncio.get_event_loop()
+            success = await loop.run_in_executor(
+                self.io_executor, s3_service.upload_file, str(local_path), s3_key
+            )
             if not success:
                 raise ConversionError(f"Failed to upload {local_path} to S3 key {s3_key}")
                 
@@ -295,55 +531,109 @@ class PDFConversionService:
         except Exception as e:
             raise ConversionError(f"Failed to upload {local_path} to S3: {str(e)}") from e
 
-    async def _validate_pdf(self, pdf_path: Path) -> Dict[str, Any]:
-        """Validate PDF file and extract basic information."""
+    async def _validate_pdf(
+        self,
+        pdf_path: Path,
+        use_cache: bool = False,
+        pdf_data: Optional[io.BytesIO] = None,
+        include_metadata: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Validate PDF file and extract basic information.
+
+        With use_cache, results are reused while the file's path, mtime and
+        size are unchanged; pdf_info["cached"] reports whether this call hit.
+        With pdf_data, the PDF is validated from memory and pdf_path is unused.
+        Without include_metadata, the document info dictionary is not read.
+        """
         try:
+            cache_key = None
+            if use_cache:
+                stat = pdf_path.stat()
+                cache_key = (str(pdf_path), stat.st_mtime_ns, stat.st_size, include_metadata)
+                pdf_info = self._validation_cache.get(cache_key)
+                if pdf_info is not None:
+                    self._validation_cache.move_to_end(cache_key)
+                    return {**pdf_info, "cached": True}
+            
             # Run PDF validation in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(self.executor, self._validate_pdf_sync, pdf_path)
+            pdf_info = await loop.run_in_executor(
+                self.executor, self._validate_pdf_sync, pdf_path, pdf_data, include_metadata
+            )
+            
+            if cache_key is not None:
+                self._validation_cache[cache_key] = pdf_info
+                if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                    self._validation_cache.popitem(last=False)
+            return {**pdf_info, "cached": False}
             
         except Exception as e:
             raise ConversionError(f"PDF validation failed: {str(e)}") from e
 
-    def _validate_pdf_sync(self, pdf_path: Path) -> Dict[str, Any]:
-        """Synchronous PDF validation using PyMuPDF."""
+    def _validate_pdf_sync(
+        self,
+        pdf_path: Path,
+        pdf_data: Optional[io.BytesIO] = None,
+        include_metadata: bool = True
+    ) -> Dict[str, Any]:
+        """Synchronous PDF validation using PyMuPDF, from disk or an in-memory buffer."""
         try:
-            doc = fitz.open(str(pdf_path))
-            
-            if doc.is_encrypted:
-                doc.close()
-                raise ConversionError("PDF is password protected and cannot be converted")
-            
-            page_count = doc.page_count
-            if page_count == 0:
-                doc.close()
-                raise ConversionError("PDF has no pages")
-            
-            if page_count > 100:  # Configurable limit
-                doc.close()
-                raise ConversionError(f"PDF has too many pages ({page_count}). Maximum allowed: 100")
-            
-            # Get file size
-            file_size = pdf_path.stat().st_size
-            size_mb = file_size / (1024 * 1024)
-            
-            # Get basic metadata
-            metadata = doc.metadata
-            
-            doc.close()
-            
-            return {
-                "pages": page_count,
-                "size_bytes": file_size,
-                "size_mb": size_mb,
-                "title": metadata.get("title", ""),
-                "author": metadata.get("author", ""),
-                "subject": metadata.get("subject", ""),
-                "creator": metadata.get("creator", ""),
-                "producer": metadata.get("producer", ""),
-                "creation_date": metadata.get("creationDate", ""),
-                "modification_date": metadata.get("modDate", "")
-            }
+            if pdf_data is not None:
+                # PyMuPDF takes the BytesIO itself; no bytes copy is made here
+                doc = fitz.open(stream=pdf_data, filetype="pdf")
+                file_size = pdf_data.getbuffer().nbytes
+            else:
+                doc = fitz.open(str(pdf_path))
+                file_size = pdf_path.stat().st_size
+            
+            # Closed on every path, including a MuPDF error on a damaged page
+            with doc:
+                if doc.is_encrypted:
+                    raise ConversionError("PDF is password protected and cannot be converted")
+                
+                page_count = doc.page_count
+                if page_count == 0:
+                    raise ConversionError("PDF has no pages")
+                
+                if page_count > MAX_PAGES:
+                    raise ConversionError(f"PDF has too many pages ({page_count}). Maximum allowed: {MAX_PAGES}")
+                
+                size_mb = file_size / (1024 * 1024)
+                
+                # Leading/trailing pages with nothing drawn on them are left out
+                # of the conversion; interior blank pages are kept for layout
+                first = 0
+                while first < page_count and not doc[first].get_bboxlog():
+                    first += 1
+                last = page_count
+                while last > first and not doc[last - 1].get_bboxlog():
+                    last -= 1
+                trimmed = first < last and (first > 0 or last < page_count)
+                
+                pdf_info = {
+                    "pages": page_count,
+                    "pages_to_convert": last - first if trimmed else page_count,
+                    "size_bytes": file_size,
+                    "size_mb": size_mb,
+                    # [start, end) for pdf2docx; None converts every page
+                    "content_page_range": [first, last] if trimmed else None,
+                }
+                
+                if include_metadata:
+                    # Get basic metadata
+                    metadata = doc.metadata
+                    pdf_info.update({
+                        "title": metadata.get("title", ""),
+                        "author": metadata.get("author", ""),
+                        "subject": metadata.get("subject", ""),
+                        "creator": metadata.get("creator", ""),
+                        "producer": metadata.get("producer", ""),
+                        "creation_date": metadata.get("creationDate", ""),
+                        "modification_date": metadata.get("modDate", "")
+                    })
+            
+            return pdf_info
             
         except Exception as e:
             raise ConversionError(f"Failed to validate PDF: {str(e)}") from e
@@ -353,19 +643,33 @@ class PDFConversionService:
         pdf_path: Path, 
         docx_path: Path, 
         quality: str,
-        include_metadata: bool
+        include_metadata: bool,
+        page_range: Optional[List[int]] = None
     ) -> Dict[str, Any]:
         """Convert PDF to DOCX asynchronously."""
         try:
-            # Run conversion in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
+            if self.process_pool is not None:
+                # pdf2docx is GIL-bound; run it in a child process
+                return await loop.run_in_executor(
+                    self.process_pool,
+                    _convert_pdf_to_docx_worker,
+                    str(pdf_path),
+                    str(docx_path),
+                    quality,
+                    include_metadata,
+                    page_range
+                )
+            
+            # Run conversion in thread pool to avoid blocking
             return await loop.run_in_executor(
                 self.executor, 
                 self._convert_pdf_to_docx_sync, 
                 pdf_path, 
                 docx_path, 
                 quality,
-                include_metadata
+                include_metadata,
+                page_range
             )
             
         except Exception as e:
@@ -376,65 +680,43 @@ class PDFConversionService:
         pdf_path: Path, 
         docx_path: Path, 
         quality: str,
-        include_metadata: bool
+        include_metadata: bool,
+        page_range: Optional[List[int]] = None
     ) -> Dict[str, Any]:
         """Synchronous PDF to DOCX conversion using pdf2docx."""
-        conversion_start = datetime.utcnow()
-        
-        try:
-            # Configure conversion parameters based on quality
-            if quality == ConversionQuality.HIGH:
-                # High quality settings
-                converter_params = {
-                    "start": 0,  # Start page
-                    "end": None,  # End page (None = all pages)
-                    "pages": None,  # Specific pages (None = all pages)
-                    "password": None,  # PDF password
-                    "multi_processing": False,  # Disable for stability
-                    "cpu_count": 1,  # Single CPU for stability
-                }
-            else:
-                # Standard quality settings (faster)
-                converter_params = {
-                    "start": 0,
-                    "end": None,
-                    "pages": None,
-                    "password": None,
-                    "multi_processing": False,
-                    "cpu_count": 1,
-                }
-            
-            # Perform conversion
-            converter = Converter(str(pdf_path))
-            converter.convert(str(docx_path), **converter_params)
-            converter.close()
-            
-            conversion_end = datetime.utcnow()
-            conversion_duration = (conversion_end - conversion_start).total_seconds()
-            
-            # Get output file size
-            output_size = docx_path.stat().st_size
-            output_size_mb = output_size / (1024 * 1024)
-            
-            return {
-                "conversion_duration_seconds": conversion_duration,
-                "output_size_bytes": output_size,
-                "output_size_mb": output_size_mb,
-                "quality": quality,
-                "include_metadata": include_metadata,
-                "converter_params": converter_params
-            }
-            
-        except Exception as e:
-            raise ConversionError(f"pdf2docx conversion failed: {str(e)}") from e
+        return _convert_pdf_to_docx_worker(
+            str(pdf_path),
+            str(docx_path),
+            quality,
+            include_metadata,
+            page_range
+        )
+
+    async def _run_qc(self, pdf_path: Path, docx_path: Path) -> Dict[str, Any]:
+        """
+        Run the QC highlight pass on the I/O thread pool.
+
+        QC rewrites the DOCX in place, so callers must await it before the
+        file is uploaded or returned.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.io_executor, qc_highlight_service.run_qc_sync, str(pdf_path), str(docx_path)
+        )
 
     async def _cleanup_temp_files(self, file_paths: list[Path]) -> None:
-        """Clean up temporary files."""
+        """Clean up temporary files in one batch on the I/O thread pool."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self.io_executor, self._cleanup_temp_files_sync, file_paths)
+
+    def _cleanup_temp_files_sync(self, file_paths: list[Path]) -> None:
+        """Synchronous temporary file removal; missing files are ignored."""
         for file_path in file_paths:
             try:
-                if file_path.exists():
-                    file_path.unlink()
-                    logger.debug(f"Cleaned up temporary file: {file_path}")
+                file_path.unlink()
+                logger.debug(f"Cleaned up temporary file: {file_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Failed to cleanup temporary file {file_path}: {e}")
 
@@ -443,8 +725,8 @@ class PDFConversionService:
         return {
             "supported_input_formats": ["pdf"],
             "supported_output_formats": ["docx"],
-            "max_pages": 100,
-            "max_file_size_mb": 50,
+            "max_pages": MAX_PAGES,
+            "max_file_size_mb": MAX_FILE_SIZE_MB,
             "quality_options": [ConversionQuality.STANDARD, ConversionQuality.HIGH],
             "features": {
                 "text_extraction": True,
@@ -455,35 +737,61 @@ class PDFConversionService:
                 "password_protected_pdfs": False
             },
             "temp_directory": str(self.temp_dir),
-            "thread_pool_workers": self.executor._max_workers
+            "thread_pool_workers": self.thread_pool_workers,
+            "io_pool_workers": self.io_pool_workers,
+            "process_pool_workers": self.process_pool_workers
         }
 
     async def cleanup_old_temp_files(self, max_age_hours: int = 24) -> int:
         """Clean up old temporary files."""
+        loop = asyncio.get_event_loop()
+        cleanup_count = await loop.run_in_executor(
+            self.io_executor, self._cleanup_old_temp_files_sync, max_age_hours * 3600
+        )
+        
+        if cleanup_count > 0:
+            logger.info(f"Cleaned up {cleanup_count} old temporary files")
+
+        return cleanup_count
+
+    def _cleanup_old_temp_files_sync(self, max_age_seconds: int) -> int:
+        """Synchronous temp dir sweep using a single scandir pass."""
         cleanup_count = 0
         current_time = datetime.utcnow().timestamp()
-        max_age_seconds = max_age_hours * 3600
         
         try:
-            for file_path in self.temp_dir.glob("*"):
-                if file_path.is_file():
-                    file_age = current_time - file_path.stat().st_mtime
-                    if file_age > max_age_seconds:
-                        try:
-                            file_path.unlink()
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    try:
+                        # Same entries as Path.glob("*"): hidden files are skipped
+                        if entry.name.startswith(".") or not entry.is_file():
+                            continue
+                        file_age = current_time - entry.stat().st_mtime
+                        if file_age > max_age_seconds:
+                            os.unlink(entry.path)
                             cleanup_count += 1
-                            logger.debug(f"Cleaned up old temp file: {file_path}")
-                        except Exception as e:
-                            logger.warning(f"Failed to cleanup old temp file {file_path}: {e}")
+                            logger.debug(f"Cleaned up old temp file: {entry.path}")
+                    except Exception as e:
+                        logger.warning(f"Failed to cleanup old temp file {entry.path}: {e}")
                             
         except Exception as e:
             logger.error(f"Error during temp file cleanup: {e}")
-            
-        if cleanup_count > 0:
-            logger.info(f"Cleaned up {cleanup_count} old temporary files")
 
         return cleanup_count
 
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the service's executors, including the process pool.
+
+        Call from the hosting app's shutdown hook so pool workers are
+        joined (or, with wait=False, released) before the process exits.
+        """
+        self.executor.shutdown(wait=wait)
+        self.io_executor.shutdown(wait=wait)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=wait)
+        logger.info("PDF Conversion Service executors shut down")
+
     async def convert_pdf_to_docx_local(
         self,
         pdf_path: str,
@@ -510,8 +818,9 @@ class PDFConversionService:
         Raises:
             ConversionError: If conversion fails
         """
-        conversion_id = str(uuid.uuid4())
+        conversion_id = uuid.uuid4().hex
         start_time = datetime.utcnow()
+        start_counter = time.perf_counter()
         pdf_path = Path(pdf_path).resolve()
 
         if not pdf_path.exists():
@@ -536,8 +845,8 @@ class PDFConversionService:
 
         try:
             # Step 1: Validate PDF file
-            pdf_info = await self._validate_pdf(pdf_path)
-            logger.info(f"PDF validation successful: {pdf_info['pages']} pages, {pdf_info['size_mb']:.2f} MB")
+            pdf_info = await self._validate_pdf(pdf_path, use_cache=True)
+            logger.info(f"PDF validation successful: {_describe_validated_pdf(pdf_info)}")
 
             # Step 2: Convert PDF to DOCX
             logger.info(f"Converting PDF to DOCX with quality: {quality}")
@@ -545,7 +854,8 @@ class PDFConversionService:
                 pdf_path,
                 output_docx,
                 quality,
-                include_metadata=True
+                include_metadata=True,
+                page_range=pdf_info["content_page_range"]
             )
 
             # Step 3: Optional QC highlighting
@@ -553,7 +863,7 @@ class PDFConversionService:
             if run_qc and HAS_QC and qc_highlight_service:
                 logger.info("Running QC highlight...")
                 try:
-                    qc_meta = qc_highlight_service.run_qc_sync(str(pdf_path), str(output_docx))
+                    qc_meta = await self._run_qc(pdf_path, output_docx)
                 except Exception as qc_error:
                     logger.warning(f"QC highlight failed: {qc_error}")
                     qc_meta = {"qc": {"error": str(qc_error)}}
@@ -561,8 +871,8 @@ class PDFConversionService:
                 logger.info("Skipping QC highlight (disabled)")
 
             # Prepare conversion metadata
-            end_time = datetime.utcnow()
-            conversion_duration = (end_time - start_time).total_seconds()
+            conversion_duration = time.perf_counter() - start_counter
+            end_time = start_time + timedelta(seconds=conversion_duration)
 
             metadata = {
                 "conversion_id": conversion_id,
@@ -1,12 +1,16 @@
 import os
 import subprocess
+import tempfile
 import xml.etree.ElementTree as ET
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 import statistics
 import argparse
 import re
-import statistics
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 
 
 # -------------------------------------------------------------
@@ -27,7 +31,7 @@ SUBSCRIPT_MAX_TOP_DIFF = 10         # Maximum 10px below
 SCRIPT_MAX_HEIGHT_RATIO = 0.75      # Script must be <75% of parent height
 
 # Symbols to exclude from script detection (avoid false positives)
-EXCLUDE_SYMBOLS = {'°', '™', '®', '©', '•', '·', '◦', '▪', '½', '¼', '¾', '⅓', '→', '←', '↑', '↓', '…', '‥'}
+EXCLUDE_SYMBOLS = frozenset({'°', '™', '®', '©', '•', '·', '◦', '▪', '½', '¼', '¾', '⅓', '→', '←', '↑', '↓', '…', '‥'})
 
 
 # -------------------------------------------------------------
@@ -60,6 +64,10 @@ def is_excluded_symbol(text):
     if text in EXCLUDE_SYMBOLS:
         return True
     
+    # Plain alphanumeric text (the common case) needs no '^'/'_' stripping
+    if text.isalnum():
+        return False
+    
     # Only allow alphanumeric scripts (excludes most symbols)
     if not text.replace('^', '').replace('_', '').isalnum():
         return True
@@ -67,7 +75,37 @@ def is_excluded_symbol(text):
     return False
 
 
-def find_adjacent_parent(script_fragment, all_fragments, script_index):
+def fragment_geometry(fragments):
+    """
+    Struct-of-arrays view of fragment boxes for the script-detection scans.
+
+    Returns one (left, right, top, bottom, height, baseline) tuple per
+    fragment, so the per-script parent search works on precomputed floats
+    instead of re-reading and re-adding dict fields for every candidate.
+    """
+    return [
+        (f["left"], f["left"] + f["width"], f["top"], f["top"] + f["height"],
+         f["height"], f["baseline"])
+        for f in fragments
+    ]
+
+
+def fragment_edge_index(geometry):
+    """
+    Sorted right and left edges for windowed parent lookups.
+
+    Returns (rights, by_right, lefts, by_left): rights[k] is the k-th
+    smallest right edge and by_right[k] its fragment index; likewise for
+    left edges.
+    """
+    by_right = sorted(range(len(geometry)), key=lambda i: geometry[i][1])
+    by_left = sorted(range(len(geometry)), key=lambda i: geometry[i][0])
+    rights = [geometry[i][1] for i in by_right]
+    lefts = [geometry[i][0] for i in by_left]
+    return rights, by_right, lefts, by_left
+
+
+def find_adjacent_parent(script_fragment, all_fragments, script_index, geometry=None, edge_index=None):
     """
     Find the parent fragment for a potential superscript/subscript.
     
@@ -78,80 +116,86 @@ def find_adjacent_parent(script_fragment, all_fragments, script_index):
     
     NEW: Check if top/bottom of script overlaps with baseline of other fragments
     
+    geometry is fragment_geometry(all_fragments); pass it in when searching
+    for many scripts on the same page so it is built only once. With
+    edge_index (fragment_edge_index(geometry)) only fragments whose right
+    edge ends, or left edge starts, within the horizontal gap of the script
+    are examined instead of the whole page.
+    
     Returns (parent_index, parent_fragment) or None.
     """
+    if geometry is None:
+        geometry = fragment_geometry(all_fragments)
+    
     script_left = script_fragment["left"]
     script_right = script_left + script_fragment["width"]
     script_top = script_fragment["top"]
     script_bottom = script_top + script_fragment["height"]
     script_height = script_fragment["height"]
-    script_baseline = script_fragment["baseline"]
-    
-    candidates = []
     
-    for i, other in enumerate(all_fragments):
+    if edge_index is None:
+        candidates = range(len(geometry))
+    else:
+        # Windows are padded by 1px so float rounding never drops a fragment;
+        # the exact gap tests below make the final decision
+        rights, by_right, lefts, by_left = edge_index
+        lo = bisect_left(rights, script_left - SCRIPT_MAX_HORIZONTAL_GAP - 1)
+        hi = bisect_right(rights, script_left + 1)
+        lo_left = bisect_left(lefts, script_right - 1)
+        hi_left = bisect_right(lefts, script_right + SCRIPT_MAX_HORIZONTAL_GAP + 1)
+        # Page order, so ties resolve exactly as in a full scan
+        candidates = sorted(set(by_right[lo:hi]).union(by_left[lo_left:hi_left]))
+    
+    # Closest candidate so far: smallest horizontal gap, then smallest
+    # vertical gap; ties keep the first one found
+    best_idx = None
+    best_key = None
+    
+    # Thresholds as locals: the loop below runs once per candidate
+    max_gap = SCRIPT_MAX_HORIZONTAL_GAP
+    max_ratio = SCRIPT_MAX_HEIGHT_RATIO
+    max_top_diff = SUBSCRIPT_MAX_TOP_DIFF
+    _abs = abs
+    
+    for i in candidates:
         if i == script_index:
             continue
+        other_left, other_right, other_top, _, other_height, other_baseline = geometry[i]
         
         # Must be larger than script
-        if other["height"] <= script_height:
+        if other_height <= script_height:
             continue
         
         # Script must be significantly smaller (height ratio check)
-        height_ratio = script_height / other["height"]
-        if height_ratio >= SCRIPT_MAX_HEIGHT_RATIO:
+        if script_height / other_height >= max_ratio:
             continue
         
-        # Check horizontal adjacency
-        other_left = other["left"]
-        other_right = other_left + other["width"]
-        other_top = other["top"]
-        other_bottom = other_top + other["height"]
-        other_baseline = other["baseline"]
+        # Vertical proximity: TOP-based detection (original logic), or the
+        # script overlaps the other fragment's baseline region
+        # (superscript: bottom near/above baseline; subscript: top near/below)
+        top_diff = _abs(script_top - other_top)
+        if top_diff > max_top_diff and not (
+                script_bottom >= other_baseline - 3 and script_top <= other_baseline + 3):
+            continue
         
         # Is script to the right of other? (most common)
         gap_right = script_left - other_right
-        if 0 <= gap_right <= SCRIPT_MAX_HORIZONTAL_GAP:
-            # NEW: Check if script overlaps with parent's baseline
-            # For superscripts: check if bottom of script overlaps with baseline of parent
-            # For subscripts: check if top of script overlaps with baseline of parent
-            
-            # Allow TOP-based detection (original logic)
-            top_diff = abs(script_top - other_top)
-            
-            # NEW: Also check baseline overlap
-            # Superscript: bottom of script should be near or above the baseline of parent
-            # Subscript: top of script should be near or below the baseline of parent
-            baseline_overlap = False
-            if script_bottom >= other_baseline - 3 and script_top <= other_baseline + 3:
-                # Script overlaps with parent's baseline region
-                baseline_overlap = True
-            
-            if top_diff <= SUBSCRIPT_MAX_TOP_DIFF or baseline_overlap:
-                candidates.append((i, other, gap_right, top_diff))
+        if 0 <= gap_right <= max_gap:
+            key = (gap_right, top_diff)
+            if best_key is None or key < best_key:
+                best_idx, best_key = i, key
         
         # Is script to the left of other? (rare)
         gap_left = other_left - script_right
-        if 0 <= gap_left <= SCRIPT_MAX_HORIZONTAL_GAP:
-            # Check vertical proximity using TOP and baseline overlap
-            top_diff = abs(script_top - other_top)
-            
-            # Check baseline overlap
-            baseline_overlap = False
-            if script_bottom >= other_baseline - 3 and script_top <= other_baseline + 3:
-                baseline_overlap = True
-            
-            if top_diff <= SUBSCRIPT_MAX_TOP_DIFF or baseline_overlap:
-                candidates.append((i, other, gap_left, top_diff))
+        if 0 <= gap_left <= max_gap:
+            key = (gap_left, top_diff)
+            if best_key is None or key < best_key:
+                best_idx, best_key = i, key
     
-    if not candidates:
+    if best_idx is None:
         return None
     
-    # Choose closest candidate (smallest horizontal gap, then smallest vertical gap)
-    candidates.sort(key=lambda x: (x[2], x[3]))
-    
-    parent_idx, parent, _, _ = candidates[0]
-    return (parent_idx, parent)
+    return (best_idx, all_fragments[best_idx])
 
 
 def detect_script_type(script_fragment, parent_fragment):
@@ -219,6 +263,7 @@ def detect_and_mark_scripts(fragments):
     
     # Detect scripts
     script_count = 0
+    geometry = None
     for i, f in enumerate(fragments):
         # Default: not a script
         f["is_script"] = False
@@ -235,7 +280,10 @@ def detect_and_mark_scripts(fragments):
             continue
         
         # Find adjacent parent fragment
-        parent_result = find_adjacent_parent(f, fragments, i)
+        if geometry is None:
+            geometry = fragment_geometry(fragments)
+            edge_index = fragment_edge_index(geometry)
+        parent_result = find_adjacent_parent(f, fragments, i, geometry, edge_index)
         if not parent_result:
             continue
         
@@ -255,7 +303,20 @@ def detect_and_mark_scripts(fragments):
     return script_count
 
 
-def merge_script_with_parent(parent, scripts):
+# Fields kept per original_fragments entry: what the unified-XML writer reads
+# (stream_index, text, is_script, script_type) plus the fragment box
+_TRACKED_FRAGMENT_KEYS = (
+    "stream_index", "text", "is_script", "script_type",
+    "left", "top", "width", "height", "baseline",
+)
+
+
+def _tracked_fragment(fragment):
+    """Slim copy of a fragment for original_fragments tracking."""
+    return {k: fragment[k] for k in _TRACKED_FRAGMENT_KEYS if k in fragment}
+
+
+def merge_script_with_parent(parent, scripts, presorted=False):
     """
     Merge one or more scripts with their parent fragment.
     
@@ -263,9 +324,14 @@ def merge_script_with_parent(parent, scripts):
     - Stores original_fragments list including parent and scripts
     - Preserves script_type metadata for proper inline element generation
     
+    original_fragments is an append-only list owned by the merged fragment:
+    if the parent already carries one, it is extended in place rather than
+    copied, so the parent should not be used after merging.
+    
     Args:
         parent: Parent fragment
-        scripts: List of script fragments to merge (sorted by position)
+        scripts: List of script fragments to merge
+        presorted: True if scripts are already sorted by left position
     
     Returns:
         Merged fragment
@@ -273,43 +339,43 @@ def merge_script_with_parent(parent, scripts):
     merged = dict(parent)  # Copy parent
     
     # Sort scripts by left position
-    scripts = sorted(scripts, key=lambda s: s["left"])
+    if not presorted:
+        scripts = sorted(scripts, key=itemgetter("left"))
     
     # NEW: Initialize fragment tracking
     if "original_fragments" in parent:
-        # Parent already has tracking from previous merge
-        merged["original_fragments"] = parent["original_fragments"].copy()
+        # Parent already has tracking from previous merge - take it over
+        merged["original_fragments"] = parent["original_fragments"]
     else:
         # Start tracking with parent
-        parent_copy = dict(parent)
-        parent_copy.pop("original_fragments", None)
-        merged["original_fragments"] = [parent_copy]
+        merged["original_fragments"] = [_tracked_fragment(parent)]
     
     # Merge text with XML tags for superscripts/subscripts
-    merged_text = parent["text"]
+    # (collected in a list and joined once, not re-concatenated per script)
+    text_parts = [parent["text"]]
     for script in scripts:
         script_text = script["text"]
 
         if script["script_type"] == "superscript":
             # Use XML superscript tag: 10<superscript>7</superscript>
-            merged_text += f"<superscript>{script_text}</superscript>"
+            text_parts.append(f"<superscript>{script_text}</superscript>")
         else:  # subscript
             # Use XML subscript tag: H<subscript>2</subscript>O
-            merged_text += f"<subscript>{script_text}</subscript>"
+            text_parts.append(f"<subscript>{script_text}</subscript>")
 
         # NEW: Track the script fragment
-        script_copy = dict(script)
-        script_copy.pop("original_fragments", None)
-        merged["original_fragments"].append(script_copy)
+        merged["original_fragments"].append(_tracked_fragment(script))
     
+    merged_text = "".join(text_parts)
     merged["text"] = merged_text
     merged["norm_text"] = " ".join(merged_text.split()).lower()
     
     # Merge inner_xml if present (preserve formatting)
     if "inner_xml" in parent:
-        merged["inner_xml"] = parent.get("inner_xml", "")
-        for script in scripts:
-            merged["inner_xml"] += script.get("inner_xml", script["text"])
+        merged["inner_xml"] = "".join(
+            [parent.get("inner_xml", "")]
+            + [script.get("inner_xml", script["text"]) for script in scripts]
+        )
     
     # Expand bounding box to include all scripts
     for script in scripts:
@@ -348,14 +414,6 @@ def merge_scripts_across_rows(rows, all_fragments):
     Returns:
         Updated rows with scripts merged
     """
-    # Build index: original_idx -> fragment
-    frag_by_idx = {}
-    for row in rows:
-        for f in row:
-            orig_idx = f.get("original_idx")
-            if orig_idx is not None:
-                frag_by_idx[orig_idx] = f
-    
     # Find all scripts and group by parent
     scripts_by_parent = {}
     script_indices = set()
@@ -370,6 +428,11 @@ def merge_scripts_across_rows(rows, all_fragments):
                     scripts_by_parent[parent_idx].append(f)
                     script_indices.add(f.get("original_idx"))
     
+    # Order each parent's scripts by left position once, here
+    left_of = itemgetter("left")
+    for scripts in scripts_by_parent.values():
+        scripts.sort(key=left_of)
+    
     # Merge scripts into their parents
     merged_rows = []
     
@@ -386,7 +449,7 @@ def merge_scripts_across_rows(rows, all_fragments):
             # Check if this fragment is a parent with scripts to merge
             if orig_idx in scripts_by_parent:
                 scripts = scripts_by_parent[orig_idx]
-                merged = merge_script_with_parent(f, scripts)
+                merged = merge_script_with_parent(f, scripts, presorted=True)
                 new_row.append(merged)
             else:
                 new_row.append(f)
@@ -400,6 +463,8 @@ def merge_scripts_across_rows(rows, all_fragments):
 # -------------------------------------------------------------
 # pdftohtml -xml runner
 # -------------------------------------------------------------
+PDFTOHTML_STDERR_TAIL_LINES = 200   # stderr lines reported when pdftohtml fails
+
 def run_pdftohtml_xml(pdf_path, out_xml_path):
     """
     Run `pdftohtml -xml` to convert the PDF into an XML that we can parse.
@@ -424,24 +489,38 @@ def run_pdftohtml_xml(pdf_path, out_xml_path):
     print("Running pdftohtml (this may take a few minutes for large PDFs)...")
     print("Command:", " ".join(cmd))
     
-    try:
-        # Run with a reasonable timeout (10 minutes for very large PDFs)
-        result = subprocess.run(cmd, check=True, timeout=600, capture_output=True, text=True)
-        print("✓ pdftohtml completed successfully")
-        return out_xml_path
-    except subprocess.TimeoutExpired:
-        print("ERROR: pdftohtml timed out after 10 minutes")
-        raise
-    except subprocess.CalledProcessError as e:
-        print(f"ERROR: pdftohtml failed with exit code {e.returncode}")
-        if e.stderr:
-            print(f"stderr: {e.stderr}")
-        raise
+    # stdout (per-page progress) is never read; stderr goes to a temp file
+    # rather than a pipe so megabytes of warnings on huge PDFs are not held
+    # in memory - only its tail is read back if the run fails
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr_file:
+        try:
+            # Run with a reasonable timeout (10 minutes for very large PDFs)
+            subprocess.run(cmd, check=True, timeout=600,
+                           stdout=subprocess.DEVNULL, stderr=stderr_file)
+            print("✓ pdftohtml completed successfully")
+            return out_xml_path
+        except subprocess.TimeoutExpired:
+            print("ERROR: pdftohtml timed out after 10 minutes")
+            raise
+        except subprocess.CalledProcessError as e:
+            print(f"ERROR: pdftohtml failed with exit code {e.returncode}")
+            stderr_file.seek(0)
+            stderr_tail = "".join(deque(stderr_file, maxlen=PDFTOHTML_STDERR_TAIL_LINES))
+            if stderr_tail:
+                print(f"stderr: {stderr_tail}")
+            raise
 
 
 # -------------------------------------------------------------
 # Reading-order & line-grouping helpers
 # -------------------------------------------------------------
+# Reference-page cues: "index", "(table of) contents", "glossary", "appendix"
+# headings, and leader dots followed by a page number
+# (e.g., "Introduction ............ 1" or "Chapter 1 . . . . . . 45")
+_REF_KEYWORD_RE = re.compile(r'index|contents|glossary|appendix')
+_REF_NUMBER_RE = re.compile(r'\.{2,}\s*\d+|…+\s*\d+')  # Multiple dots followed by number
+
+
 def _is_reference_page(fragments):
     """
     Detect if this is a reference page (Index, TOC, Glossary, etc.)
@@ -458,22 +537,20 @@ def _is_reference_page(fragments):
     
     # Check for reference keywords in first few fragments
     first_texts = " ".join(f.get("norm_text", "") for f in fragments[:10]).lower()
-    reference_keywords = ["index", "table of contents", "contents", "glossary", "appendix"]
-    has_keyword = any(keyword in first_texts for keyword in reference_keywords)
+    if _REF_KEYWORD_RE.search(first_texts):
+        return True
     
     # Check proportion of fragments with page numbers (dots followed by numbers)
-    # e.g., "Introduction ............ 1" or "Chapter 1 . . . . . . 45"
-    import re
-    number_pattern = re.compile(r'\.{2,}\s*\d+|…+\s*\d+')  # Multiple dots followed by number
-    fragments_with_numbers = sum(1 for f in fragments if number_pattern.search(f.get("text", "")))
-    number_ratio = fragments_with_numbers / len(fragments) if fragments else 0
+    fragments_with_numbers = sum(1 for f in fragments if _REF_NUMBER_RE.search(f.get("text", "")))
+    number_ratio = fragments_with_numbers / len(fragments)
+    if number_ratio <= 0.3:
+        return False
     
     # Check average text length (reference entries are typically short)
-    texts = [f.get("text", "") for f in fragments]
-    avg_length = sum(len(t) for t in texts) / len(texts) if texts else 0
+    avg_length = sum(len(f.get("text", "")) for f in fragments) / len(fragments)
     
-    # Reference page if has keyword OR high number ratio with short entries
-    return has_keyword or (number_ratio > 0.3 and avg_length < 100)
+    # Reference page if high number ratio with short entries
+    return avg_length < 100
 
 
 def _are_columns_side_by_side(fragments, positive_cols):
@@ -488,13 +565,23 @@ def _are_columns_side_by_side(fragments, positive_cols):
     if len(positive_cols) < 2:
         return True
     
-    # Get vertical range for each column
-    col_ranges = {}
-    for col_id in positive_cols:
-        col_frags = [f for f in fragments if f["col_id"] == col_id]
-        if col_frags:
-            baselines = [f["baseline"] for f in col_frags]
-            col_ranges[col_id] = (min(baselines), max(baselines))
+    # Get vertical range for each column in a single pass over the fragments
+    wanted = set(positive_cols)
+    col_min = {}
+    col_max = {}
+    for f in fragments:
+        col_id = f["col_id"]
+        if col_id not in wanted:
+            continue
+        b = f["baseline"]
+        if col_id not in col_min:
+            col_min[col_id] = col_max[col_id] = b
+        else:
+            if b < col_min[col_id]:
+                col_min[col_id] = b
+            if b > col_max[col_id]:
+                col_max[col_id] = b
+    col_ranges = {col_id: (col_min[col_id], col_max[col_id]) for col_id in col_min}
     
     # Check overlap between consecutive columns
     cols = sorted(col_ranges.keys())
@@ -540,23 +627,36 @@ def _assign_column_by_column(fragments, positive_cols):
     if not fragments:
         return
 
-    # Separate full-width (col_id=0) from columnar content
-    fullwidth_frags = [f for f in fragments if f["col_id"] == 0]
-    columnar_frags = [f for f in fragments if f["col_id"] > 0]
+    # Separate full-width (col_id=0) from columnar content in one pass,
+    # bucketing columnar fragments by col_id and tracking the top baseline
+    fullwidth_frags = []
+    col_buckets = {}
+    columnar_top = None
+    for f in fragments:
+        col_id = f["col_id"]
+        if col_id == 0:
+            fullwidth_frags.append(f)
+        elif col_id > 0:
+            col_buckets.setdefault(col_id, []).append(f)
+            b = f["baseline"]
+            if columnar_top is None or b < columnar_top:
+                columnar_top = b
 
     # If no columnar content, assign Block 1 to everything
-    if not columnar_frags:
+    if not col_buckets:
         for f in fragments:
             f["reading_order_block"] = 1
         return
 
-    # Find the vertical boundary between header and columnar content
-    columnar_baselines = [f["baseline"] for f in columnar_frags]
-    columnar_top = min(columnar_baselines)
-
     # Classify full-width content as header (above columns) or other (at/below column start)
-    header_frags = [f for f in fullwidth_frags if f["baseline"] < columnar_top]
-    other_fullwidth_frags = [f for f in fullwidth_frags if f["baseline"] >= columnar_top]
+    header_frags = []
+    other_fullwidth_frags = []
+    for f in fullwidth_frags:
+        b = f["baseline"]
+        if b < columnar_top:
+            header_frags.append(f)
+        elif b >= columnar_top:
+            other_fullwidth_frags.append(f)
 
     # Assign block numbers
     block_num = 1
@@ -569,7 +669,7 @@ def _assign_column_by_column(fragments, positive_cols):
 
     # Blocks for each column: read all content in column 1, then column 2, etc.
     for col_id in sorted(positive_cols):
-        col_frags = [f for f in columnar_frags if f["col_id"] == col_id]
+        col_frags = col_buckets.get(col_id)
         if col_frags:
             for f in col_frags:
                 f["reading_order_block"] = block_num
@@ -592,19 +692,17 @@ def _assign_interleaved(fragments):
     # Sort fragments by baseline (top to bottom)
     sorted_frags = sorted(fragments, key=lambda f: (f["baseline"], f.get("left", 0)))
     
-    # Assign blocks based on col_id transitions
+    # Assign blocks based on col_id transitions: one block per run of equal
+    # col_id (a leading run with col_id None stays in block 0)
     block_num = 0
-    prev_col_id = None
     
-    for frag in sorted_frags:
-        current_col_id = frag["col_id"]
-        
+    for col_id, run in groupby(sorted_frags, key=itemgetter("col_id")):
         # Start a new block when col_id changes
-        if current_col_id != prev_col_id:
+        if block_num or col_id is not None:
             block_num += 1
-            prev_col_id = current_col_id
         
-        frag["reading_order_block"] = block_num
+        for frag in run:
+            frag["reading_order_block"] = block_num
 
 
 def assign_normalized_baselines(rows):
@@ -658,14 +756,27 @@ def assign_reading_order_blocks(fragments, rows):
         if "norm_baseline" not in f:
             f["norm_baseline"] = f["baseline"]
 
+    # Struct-of-arrays view: the scans below work on fragment indices and
+    # read these fields once instead of indexing every dict on every pass
+    n = len(fragments)
+    norm_baselines = [f["norm_baseline"] for f in fragments]
+    col_ids = [f["col_id"] for f in fragments]
+    lefts = [f["left"] for f in fragments]
+
+    # Group fragment indices by normalized baseline once (page order within
+    # each group), so "fragments at baseline X" is a lookup, not a page scan
+    frags_at_baseline = {}
+    for i, nb in enumerate(norm_baselines):
+        frags_at_baseline.setdefault(nb, []).append(i)
+
     # Get sorted unique normalized baselines
-    sorted_baselines = sorted(set(f["norm_baseline"] for f in fragments))
+    sorted_baselines = sorted(frags_at_baseline)
 
     if not sorted_baselines:
         return
 
-    # Track which fragments have been processed
-    processed = set()
+    # Track which fragments (by index) have been processed
+    processed = [False] * n
     reading_order_block = 1
 
     # Track the previous structure type for block increment decisions
@@ -677,18 +788,17 @@ def assign_reading_order_blocks(fragments, rows):
         baseline = sorted_baselines[baseline_idx]
 
         # Get unprocessed fragments at this baseline
-        baseline_frags = [f for f in fragments
-                         if f["norm_baseline"] == baseline and id(f) not in processed]
+        baseline_frags = [i for i in frags_at_baseline[baseline] if not processed[i]]
 
         if not baseline_frags:
             baseline_idx += 1
             continue
 
         # Determine column structure at this baseline
-        col_ids_at_baseline = sorted(set(f["col_id"] for f in baseline_frags if f["col_id"] is not None))
+        col_ids_at_baseline = sorted(set(col_ids[i] for i in baseline_frags if col_ids[i] is not None))
 
         # Check if all fragments are full-width (ColID 0)
-        all_fullwidth = all(f["col_id"] == 0 for f in baseline_frags)
+        all_fullwidth = all(col_ids[i] == 0 for i in baseline_frags)
 
         # Check for multi-column (more than one distinct ColID, excluding 0)
         positive_cols = [c for c in col_ids_at_baseline if c > 0]
@@ -700,9 +810,9 @@ def assign_reading_order_blocks(fragments, rows):
             if prev_structure is not None and prev_structure != "fullwidth":
                 reading_order_block += 1
 
-            for f in baseline_frags:
-                f["reading_order_block"] = reading_order_block
-                processed.add(id(f))
+            for i in baseline_frags:
+                fragments[i]["reading_order_block"] = reading_order_block
+                processed[i] = True
 
             prev_structure = "fullwidth"
             baseline_idx += 1
@@ -720,15 +830,14 @@ def assign_reading_order_blocks(fragments, rows):
 
             for check_idx in range(baseline_idx + 1, len(sorted_baselines)):
                 check_baseline = sorted_baselines[check_idx]
-                check_frags = [f for f in fragments
-                              if f["norm_baseline"] == check_baseline and id(f) not in processed]
+                check_frags = [i for i in frags_at_baseline[check_baseline] if not processed[i]]
 
                 if not check_frags:
                     # Empty baseline - end of multi-col block
                     multi_col_end_idx = check_idx
                     break
 
-                check_cols = set(f["col_id"] for f in check_frags if f["col_id"] is not None)
+                check_cols = set(col_ids[i] for i in check_frags if col_ids[i] is not None)
 
                 # End if we hit full-width only content
                 if check_cols == {0}:
@@ -737,22 +846,22 @@ def assign_reading_order_blocks(fragments, rows):
 
             # Get all fragments in this multi-column block region
             block_baselines = sorted_baselines[multi_col_start_idx:multi_col_end_idx]
-            block_frags = [f for f in fragments
-                          if f["norm_baseline"] in block_baselines and id(f) not in processed]
+            block_frags = sorted(i for b in block_baselines
+                                 for i in frags_at_baseline[b] if not processed[i])
 
             # Find all column IDs in this block (excluding ColID 0)
-            cols_in_block = sorted(set(f["col_id"] for f in block_frags
-                                      if f["col_id"] is not None and f["col_id"] > 0))
+            cols_in_block = sorted(set(col_ids[i] for i in block_frags
+                                      if col_ids[i] is not None and col_ids[i] > 0))
 
             # Process each column in order (left to right: col 1, col 2, ...)
             for col_id in cols_in_block:
-                col_frags = [f for f in block_frags if f["col_id"] == col_id]
+                col_frags = [i for i in block_frags if col_ids[i] == col_id]
                 # Sort by normalized baseline (top to bottom within column)
-                col_frags_sorted = sorted(col_frags, key=lambda f: (f["norm_baseline"], f["left"]))
+                col_frags_sorted = sorted(col_frags, key=lambda i: (norm_baselines[i], lefts[i]))
 
-                for f in col_frags_sorted:
-                    f["reading_order_block"] = reading_order_block
-                    processed.add(id(f))
+                for i in col_frags_sorted:
+                    fragments[i]["reading_order_block"] = reading_order_block
+                    processed[i] = True
 
                 # Increment block for next column
                 if col_id != cols_in_block[-1]:  # Don't increment after last column
@@ -760,12 +869,12 @@ def assign_reading_order_blocks(fragments, rows):
 
             # Handle any ColID 0 fragments within the multi-col region
             # (e.g., section headers that span columns)
-            col0_in_block = [f for f in block_frags if f["col_id"] == 0 and id(f) not in processed]
+            col0_in_block = [i for i in block_frags if col_ids[i] == 0 and not processed[i]]
             if col0_in_block:
                 reading_order_block += 1
-                for f in sorted(col0_in_block, key=lambda f: f["norm_baseline"]):
-                    f["reading_order_block"] = reading_order_block
-                    processed.add(id(f))
+                for i in sorted(col0_in_block, key=lambda i: norm_baselines[i]):
+                    fragments[i]["reading_order_block"] = reading_order_block
+                    processed[i] = True
 
             prev_structure = "multi_col"
             # Jump to end of multi-col block
@@ -778,19 +887,19 @@ def assign_reading_order_blocks(fragments, rows):
             if prev_structure is not None and prev_structure != "single_col":
                 reading_order_block += 1
 
-            for f in baseline_frags:
-                f["reading_order_block"] = reading_order_block
-                processed.add(id(f))
+            for i in baseline_frags:
+                fragments[i]["reading_order_block"] = reading_order_block
+                processed[i] = True
 
             prev_structure = "single_col"
             baseline_idx += 1
 
     # Handle any remaining unprocessed fragments (shouldn't happen normally)
-    remaining = [f for f in fragments if id(f) not in processed]
+    remaining = [i for i in range(n) if not processed[i]]
     if remaining:
         reading_order_block += 1
-        for f in remaining:
-            f["reading_order_block"] = reading_order_block
+        for i in remaining:
+            fragments[i]["reading_order_block"] = reading_order_block
 
 
 def compute_baseline_tolerance(baselines):
@@ -804,11 +913,9 @@ def compute_baseline_tolerance(baselines):
     if len(baselines) < 2:
         return 4.0  # Increased from 2.0
     b_sorted = sorted(baselines)
-    diffs = [
-        b_sorted[i + 1] - b_sorted[i]
-        for i in range(len(b_sorted) - 1)
-        if b_sorted[i + 1] > b_sorted[i]
-    ]
+    # Positive gaps between consecutive sorted baselines, pairing the list
+    # with its own tail instead of indexing twice per step
+    diffs = [b - a for a, b in zip(b_sorted, b_sorted[1:]) if b > a]
     if not diffs:
         return 4.0  # Increased from 2.0
     line_spacing = statistics.median(diffs)
@@ -831,29 +938,32 @@ def group_fragments_into_lines(fragments, baseline_tol):
     lines = []
     current = []
     current_baseline = None
+    baseline_sum = 0.0
 
     for f in fragments:
         b = f["baseline"]
         if current_baseline is None:
             current = [f]
-            current_baseline = b
+            current_baseline = baseline_sum = b
         elif abs(b - current_baseline) <= baseline_tol:
             # Add to current line
             current.append(f)
             # Update baseline to average of all fragments in line
             # This makes the grouping more robust to font size variations
-            current_baseline = sum(frag["baseline"] for frag in current) / len(current)
+            # (running sum, so each fragment is added once, not re-summed)
+            baseline_sum += b
+            current_baseline = baseline_sum / len(current)
         else:
             lines.append(current)
             current = [f]
-            current_baseline = b
+            current_baseline = baseline_sum = b
 
     if current:
         lines.append(current)
     return lines
 
 
-def get_flattened_fragments(frag):
+def get_flattened_fragments(frag, copy=False):
     """
     Get original fragments from a fragment, flattening any nested ones.
 
@@ -862,13 +972,18 @@ def get_flattened_fragments(frag):
 
     Args:
         frag: A fragment that may have original_fragments
+        copy: If True, also copy each nested original fragment dict. By
+              default the returned list is new but shares its entries with
+              frag's list, which is enough for callers that only extend it.
 
     Returns:
         List of flattened original fragments
     """
     if "original_fragments" in frag:
         # Fragment has nested original_fragments - use them directly
-        return [dict(f) for f in frag["original_fragments"]]
+        if copy:
+            return [dict(f) for f in frag["original_fragments"]]
+        return list(frag["original_fragments"])
     else:
         # Single fragment - wrap in list
         frag_copy = dict(frag)
@@ -991,22 +1106,31 @@ def merge_paragraphs_across_pages(all_pages_data, page_order):
             if was_dehyphenated:
                 # Dehyphenated - join without space
                 merged_text = last_text_mod + first_text_mod
+                merged_norm = " ".join(merged_text.split()).lower()
             else:
                 # Normal merge - join with space if needed
                 if last_text.endswith(' ') or first_text.startswith(' '):
                     merged_text = last_text + first_text
                 else:
                     merged_text = last_text + ' ' + first_text
+                # A space always separates the two texts here, so the merged
+                # norm_text is the two normalized halves joined by a space;
+                # the (possibly long) page-end text is not re-normalized
+                last_norm = last_frag.get("norm_text")
+                if last_norm is None:
+                    last_norm = " ".join(last_text.split()).lower()
+                first_norm = " ".join(first_text.split()).lower()
+                merged_norm = " ".join(part for part in (last_norm, first_norm) if part)
             
             # Update last fragment of current page
             last_frag["text"] = merged_text
-            last_frag["norm_text"] = " ".join(merged_text.split()).lower()
+            last_frag["norm_text"] = merged_norm
 
             # Merge original_fragments to preserve subscript/superscript info
             # Use get_flattened_fragments to handle nested original_fragments
             if "original_fragments" not in last_frag:
-                last_frag["original_fragments"] = get_flattened_fragments(last_frag)
-            last_frag["original_fragments"].extend(get_flattened_fragments(first_frag))
+                last_frag["original_fragments"] = get_flattened_fragments(last_frag, copy=True)
+            last_frag["original_fragments"].extend(get_flattened_fragments(first_frag, copy=True))
 
             # Propagate has_merged_scripts flag if first_frag had scripts
             if first_frag.get("has_merged_scripts"):
@@ -1101,6 +1225,18 @@ def remove_soft_hyphen(current_text, next_text):
     return current_dehyphenated + trailing_space_in_current, leading_space_in_next + next_stripped, True
 
 
+# Inline-merge character classes and words (see merge_inline_fragments_in_row)
+PUNCTUATION_CHARS = frozenset({'.', ',', ';', ':', '!', '?', ')', ']', '}', '"', "'", '…', '»', '›'})
+BULLET_CHARS = frozenset({'•', '●', '○', '■', '□', '▪', '▫', '·', '-', '*', '–', '—', '→', '⇒', '▸', '►'})
+CONTINUATION_WORDS = frozenset({'including', 'and', 'or', 'the', 'for', 'in', 'of', 'to', 'a', 'an',
+                                'as', 'with', 'from', 'by', 'at', 'on', 'into', 'through', 'during',
+                                'such', 'both', 'each', 'all', 'other', 'these', 'those', 'many'})
+# Each continuation word, bare or followed by a comma, for one str.endswith call
+_CONTINUATION_SUFFIXES = tuple(
+    suffix for word in CONTINUATION_WORDS for suffix in (word, word + ',')
+)
+
+
 def merge_inline_fragments_in_row(row, gap_tolerance=5.0, space_width=1.0):
     """
     Merge adjacent fragments on the same baseline using enhanced rules.
@@ -1151,62 +1287,57 @@ def merge_inline_fragments_in_row(row, gap_tolerance=5.0, space_width=1.0):
         return []
 
     # Sort left-to-right
-    row = sorted(row, key=lambda f: f["left"])
-
-    merged = []
-    current = dict(row[0])  # copy so we don't mutate original
+    row = sorted(row, key=itemgetter("left"))
+
+    # The fragment being built is kept as locals (its first source fragment
+    # plus the running text/inner_xml/width) and only turned into a dict
+    # once it is complete, instead of copying and rewriting a dict per merge
+    groups = []
+    start = row[0]
+    current_left = start["left"]
+    current_width = start["width"]
+    current_height = start.get("height", 0)
+    current_txt = start.get("text", "")
+    has_inner = "inner_xml" in start
+    current_inner = start.get("inner_xml")
+    was_merged = False
 
     # Track original fragments for RittDocDTD compliance
     # Use module-level get_flattened_fragments to preserve script info from nested merges
-    current["original_fragments"] = get_flattened_fragments(row[0])
+    original_fragments = get_flattened_fragments(start)
 
     for f in row[1:]:
         txt = f.get("text", "")
-        current_txt = current.get("text", "")
 
         # Compute the horizontal gap between current and next
-        base_end = current["left"] + current["width"]
+        base_end = current_left + current_width
         gap = f["left"] - base_end
 
-        should_merge = False
+        # --- Phase 3: inline-style / no-gap merge ---
+        # Checked first: it is pure arithmetic, and it also covers Phase 2
+        # (trailing space detection), which merges only when |gap| <= gap_tolerance
+        should_merge = abs(gap) <= gap_tolerance
         
         # --- SPECIAL CASE: Punctuation merging ---
         # Punctuation marks (., , ; : ! ? ) etc.) should ALWAYS merge with preceding text
         # They often appear as separate elements due to different positioning
-        PUNCTUATION_CHARS = {'.', ',', ';', ':', '!', '?', ')', ']', '}', '"', "'", '…', '»', '›'}
-        txt_stripped = txt.strip()
-        
         # Check if next fragment is ONLY punctuation (possibly with whitespace)
-        if txt_stripped and all(c in PUNCTUATION_CHARS or c.isspace() for c in txt_stripped):
+        if not should_merge and gap <= 10.0:
             # Punctuation element - merge if reasonably close (within 10px)
-            if gap <= 10.0:
+            txt_stripped = txt.strip()
+            if txt_stripped and all(c in PUNCTUATION_CHARS or c.isspace() for c in txt_stripped):
                 should_merge = True
         
         # --- SPECIAL CASE: Bullet point merging ---
         # Detect if current is a bullet character and next is text
         # Bullets are often positioned differently (different baseline/height)
         # So we need more lenient merging for bullets
-        if not should_merge:
-            BULLET_CHARS = {'•', '●', '○', '■', '□', '▪', '▫', '·', '-', '*', '–', '—', '→', '⇒', '▸', '►'}
+        if not should_merge and gap <= 20.0:  # More lenient for bullets
             current_stripped = current_txt.strip()
             
             if current_stripped in BULLET_CHARS and len(current_stripped) == 1:
                 # Current is a bullet character - merge with following text if reasonably close
                 # Allow larger gap (up to 20px) since bullets are often positioned differently
-                if gap <= 20.0:  # More lenient for bullets
-                    should_merge = True
-
-        # --- Phase 2: trailing space detection ---
-        # If current ends with space and next does NOT start with space
-        if not should_merge and current_txt.endswith(" ") and not txt.startswith(" "):
-            # Check if gap is small (approximately zero)
-            if abs(gap) <= gap_tolerance:
-                should_merge = True
-
-        # --- Phase 3: inline-style / no-gap merge ---
-        if not should_merge:
-            nogap = abs(gap) <= gap_tolerance
-            if nogap:
                 should_merge = True
 
         # --- Phase 4: starts-with-space + "space gap" (± tolerance) ---
@@ -1219,7 +1350,6 @@ def merge_inline_fragments_in_row(row, gap_tolerance=5.0, space_width=1.0):
         # --- Phase 5: Small gap relative to text height (handles font variations) ---
         # If gap is small compared to text height, likely same word/phrase with font change
         if not should_merge:
-            current_height = current.get("height", 0)
             next_height = f.get("height", 0)
             min_height = min(current_height, next_height) if current_height > 0 and next_height > 0 else 0
             
@@ -1233,19 +1363,14 @@ def merge_inline_fragments_in_row(row, gap_tolerance=5.0, space_width=1.0):
         # This handles cases like "including Journal Name" where font style changes
         if not should_merge and gap > 0 and gap <= 15.0:
             current_txt_lower = current_txt.lower().rstrip()
-            continuation_words = {'including', 'and', 'or', 'the', 'for', 'in', 'of', 'to', 'a', 'an',
-                                 'as', 'with', 'from', 'by', 'at', 'on', 'into', 'through', 'during',
-                                 'such', 'both', 'each', 'all', 'other', 'these', 'those', 'many'}
             
             # Check if current text ends with a continuation word
-            for word in continuation_words:
-                if current_txt_lower.endswith(word) or current_txt_lower.endswith(word + ','):
-                    should_merge = True
-                    break
+            if current_txt_lower.endswith(_CONTINUATION_SUFFIXES):
+                should_merge = True
 
         if should_merge:
             # NEW: Check for soft hyphen before merging
-            current_txt_before = current.get("text", "")
+            current_txt_before = current_txt
             next_txt_before = txt
             current_txt_dehyph, next_txt_dehyph, was_dehyphenated = remove_soft_hyphen(
                 current_txt_before, next_txt_before
@@ -1253,38 +1378,61 @@ def merge_inline_fragments_in_row(row, gap_tolerance=5.0, space_width=1.0):
             
             if was_dehyphenated:
                 # Update texts after dehyphenation
-                current["text"] = current_txt_dehyph + next_txt_dehyph
+                current_txt = current_txt_dehyph + next_txt_dehyph
                 # Also update inner_xml to reflect dehyphenation
                 # Remove trailing hyphen from inner_xml if present
-                current_inner = current.get("inner_xml", current_txt_before)
+                if not has_inner:
+                    current_inner = current_txt_before
                 next_inner = f.get("inner_xml", next_txt_before)
                 if current_inner.rstrip().endswith('-'):
                     current_inner = current_inner.rstrip()[:-1] + current_inner[len(current_inner.rstrip()):]
-                current["inner_xml"] = current_inner + next_inner
+                current_inner = current_inner + next_inner
             else:
                 # Merge: append text as-is (keep whatever spaces are in txt)
-                current["text"] = current.get("text", "") + txt
+                current_txt = current_txt + txt
                 # Merge XML content to preserve formatting
-                current["inner_xml"] = current.get("inner_xml", "") + f.get("inner_xml", txt)
-            
-            current["norm_text"] = " ".join(current["text"].split()).lower()
+                current_inner = (current_inner if has_inner else "") + f.get("inner_xml", txt)
+            has_inner = True
+            was_merged = True
 
             # Expand width to cover the new fragment
-            prev_end = current["left"] + current["width"]
+            prev_end = current_left + current_width
             right = max(prev_end, f["left"] + f["width"])
-            current["width"] = right - current["left"]
+            current_width = right - current_left
             
             # NEW: Track the merged fragment (flatten nested original_fragments)
-            current["original_fragments"].extend(get_flattened_fragments(f))
+            original_fragments.extend(get_flattened_fragments(f))
         else:
             # Start a new logical fragment
-            merged.append(current)
-            current = dict(f)
+            groups.append((start, original_fragments, was_merged,
+                           current_txt, current_inner, current_width))
+            start = f
+            current_left = f["left"]
+            current_width = f["width"]
+            current_height = f.get("height", 0)
+            current_txt = txt
+            has_inner = "inner_xml" in f
+            current_inner = f.get("inner_xml")
+            was_merged = False
 
             # NEW: Initialize tracking for new fragment (flatten nested original_fragments)
-            current["original_fragments"] = get_flattened_fragments(f)
+            original_fragments = get_flattened_fragments(f)
 
-    merged.append(current)
+    groups.append((start, original_fragments, was_merged,
+                   current_txt, current_inner, current_width))
+
+    # Materialize one dict per logical fragment (a copy, so the input
+    # fragments are never mutated)
+    merged = []
+    for start, original_fragments, was_merged, text, inner_xml, width in groups:
+        current = dict(start)
+        current["original_fragments"] = original_fragments
+        if was_merged:
+            current["text"] = text
+            current["inner_xml"] = inner_xml
+            current["norm_text"] = " ".join(text.split()).lower()
+            current["width"] = width
+        merged.append(current)
     return merged
 
 
@@ -1293,6 +1441,23 @@ def merge_inline_fragments_in_row(row, gap_tolerance=5.0, space_width=1.0):
 # ---------------------------------------
 # Fragment filtering (headers/footers)
 # ---------------------------------------
+# Print-layout junk: InDesign file names, dates like 12/18/18, times like 3:45 pm
+_LAYOUT_JUNK_RE = re.compile(
+    r"\.indd\b"
+    r"|\b\d{1,2}/\d{1,2}/\d{2,4}\b"
+    r"|\b\d{1,2}:\d{2}\s*(am|pm)\b"
+)
+_SLUG_NUMERAL_RE = re.compile(r"[a-z0-9_\-]+\s+vi|vii|iv")
+_ARABIC_PAGE_NUMBER_RE = re.compile(r'^\d{1,4}$')
+_ROMAN_PAGE_NUMBER_RE = re.compile(r'^[ivxlcdm]+$', re.IGNORECASE)
+# Front-matter numerals i..xxx (lowercase, as in norm_text): a set lookup
+# settles the usual cases before falling back to _ROMAN_PAGE_NUMBER_RE
+_ROMAN_NUMERALS = frozenset(
+    "i ii iii iv v vi vii viii ix x xi xii xiii xiv xv xvi xvii xviii xix xx "
+    "xxi xxii xxiii xxiv xxv xxvi xxvii xxviii xxix xxx".split()
+)
+
+
 def should_skip_fragment(norm_txt, top, height, page_height, seen_footer_texts):
 
     # 1) Skip if outside visible page render area
@@ -1302,13 +1467,10 @@ def should_skip_fragment(norm_txt, top, height, page_height, seen_footer_texts):
         return True
 
     # 2) Skip file names, indesign junk, timestamps
-    if re.search(r"\.indd\b", norm_txt):
-        return True
-    if re.search(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b", norm_txt):
-        return True  # dates like 12/18/18
-    if re.search(r"\b\d{1,2}:\d{2}\s*(am|pm)\b", norm_txt):
+    # (one alternation search covers file names, dates and timestamps)
+    if _LAYOUT_JUNK_RE.search(norm_txt):
         return True
-    if re.fullmatch(r"[a-z0-9_\-]+\s+vi|vii|iv", norm_txt):
+    if _SLUG_NUMERAL_RE.fullmatch(norm_txt):
         return True
 
     # 3) Skip extremely small-height invisible text
@@ -1331,10 +1493,10 @@ def should_skip_fragment(norm_txt, top, height, page_height, seen_footer_texts):
         if is_header_zone or is_footer_zone:
             text_stripped = norm_txt.strip()
             # Arabic page numbers (1-9999)
-            if re.match(r'^\d{1,4}$', text_stripped):
+            if _ARABIC_PAGE_NUMBER_RE.match(text_stripped):
                 return True
             # Roman numerals (i, ii, iii, iv, v, vi, vii, viii, ix, x, etc.)
-            if re.match(r'^[ivxlcdm]+$', text_stripped, re.IGNORECASE):
+            if text_stripped in _ROMAN_NUMERALS or _ROMAN_PAGE_NUMBER_RE.match(text_stripped):
                 return True
 
     return False
@@ -1380,20 +1542,22 @@ def compute_dynamic_column_gap_threshold(fragments, page_width, baseline_toleran
 
     current_baseline = None
     current_group = []
+    baseline_sum = 0.0
 
     for frag in sorted_frags:
         b = get_baseline(frag)
         if current_baseline is None:
-            current_baseline = b
+            current_baseline = baseline_sum = b
             current_group = [frag]
         elif abs(b - current_baseline) <= baseline_tolerance:
             current_group.append(frag)
             # Update baseline to running average for better grouping
-            current_baseline = sum(get_baseline(f) for f in current_group) / len(current_group)
+            baseline_sum += b
+            current_baseline = baseline_sum / len(current_group)
         else:
             if current_group:
                 baseline_groups[current_baseline] = current_group
-            current_baseline = b
+            current_baseline = baseline_sum = b
             current_group = [frag]
 
     if current_group:
@@ -1407,13 +1571,10 @@ def compute_dynamic_column_gap_threshold(fragments, page_width, baseline_toleran
             continue
 
         # Sort fragments left to right
-        sorted_line_frags = sorted(frags, key=lambda f: f["left"])
+        sorted_line_frags = sorted(frags, key=itemgetter("left"))
 
         # Measure gaps between consecutive fragments
-        for i in range(len(sorted_line_frags) - 1):
-            frag_a = sorted_line_frags[i]
-            frag_b = sorted_line_frags[i + 1]
-
+        for frag_a, frag_b in zip(sorted_line_frags, sorted_line_frags[1:]):
             # Gap = start of next fragment - end of current fragment
             gap = frag_b["left"] - (frag_a["left"] + frag_a["width"])
 
@@ -1426,9 +1587,15 @@ def compute_dynamic_column_gap_threshold(fragments, page_width, baseline_toleran
 
     # Sort gaps for analysis
     gaps_sorted = sorted(all_gaps)
+    n_gaps = len(gaps_sorted)
     min_gap = gaps_sorted[0]
     max_gap = gaps_sorted[-1]
-    median_gap = statistics.median(gaps_sorted)
+    # Median read off the sorted list (statistics.median would sort again)
+    mid = n_gaps // 2
+    if n_gaps % 2:
+        median_gap = gaps_sorted[mid]
+    else:
+        median_gap = (gaps_sorted[mid - 1] + gaps_sorted[mid]) / 2
 
     # Check for bimodal distribution (word gaps + column gaps)
     # A large ratio between max and min suggests bimodal
@@ -1443,7 +1610,7 @@ def compute_dynamic_column_gap_threshold(fragments, page_width, baseline_toleran
     # Fix for full-line XML fragments: When XML has full text lines (not words),
     # column gaps are small but short lines create outlier large gaps that inflate variance.
     # Use IQR-based outlier filtering for wide fragments.
-    avg_fragment_width = statistics.mean([f["width"] for f in fragments])
+    avg_fragment_width = statistics.fmean(f["width"] for f in fragments)
     fragments_are_wide = avg_fragment_width > page_width * 0.25
 
     if fragments_are_wide and len(all_gaps) >= 8:
@@ -1458,7 +1625,7 @@ def compute_dynamic_column_gap_threshold(fragments, page_width, baseline_toleran
         filtered_gaps = [g for g in all_gaps if lower_bound <= g <= upper_bound]
 
         if len(filtered_gaps) >= 5:
-            filtered_mean = statistics.mean(filtered_gaps)
+            filtered_mean = statistics.fmean(filtered_gaps)
             filtered_stdev = statistics.stdev(filtered_gaps) if len(filtered_gaps) > 1 else 0
             filtered_cv = filtered_stdev / filtered_mean if filtered_mean > 0 else 0
 
@@ -1472,20 +1639,21 @@ def compute_dynamic_column_gap_threshold(fragments, page_width, baseline_toleran
     # Use 3% instead of 5% to catch narrower column gaps
     large_gap_threshold = page_width * 0.03  # 3% of page width
 
-    # Count small vs large gaps
-    small_gaps = [g for g in all_gaps if g < large_gap_threshold]
-    large_gaps = [g for g in all_gaps if g >= large_gap_threshold]
+    # Count small vs large gaps (split of the sorted gaps at the threshold)
+    split = bisect_left(gaps_sorted, large_gap_threshold)
+    small_gaps = gaps_sorted[:split]
+    large_gaps = gaps_sorted[split:]
 
     if small_gaps and large_gaps and len(large_gaps) >= 3:
         # BIMODAL: We have both word gaps and column gaps
         # Threshold should be between max small gap and min large gap
-        max_small = max(small_gaps)
-        min_large = min(large_gaps)
+        max_small = small_gaps[-1]
+        min_large = large_gaps[0]
         column_gap_threshold = (max_small + min_large) / 2.0
     elif large_gaps and not small_gaps:
         # ALL LARGE GAPS: Likely a multi-column layout with no word breaks
         # Use a fraction of the minimum large gap (e.g., 70% of smallest column gap)
-        column_gap_threshold = min(large_gaps) * 0.70
+        column_gap_threshold = large_gaps[0] * 0.70
     elif gap_ratio > 3.0 and len(all_gaps) >= 5:
         # Significant spread in gap sizes - try to find natural break point
         # Use a multiple of the 25th percentile (word gaps) but less than median
@@ -1555,19 +1723,21 @@ def detect_columns_baseline_based(fragments, page_width, baseline_tolerance=3.0,
 
     current_baseline = None
     current_group = []
+    baseline_sum = 0.0
 
     for frag in sorted_frags:
         b = get_baseline(frag)
         if current_baseline is None:
-            current_baseline = b
+            current_baseline = baseline_sum = b
             current_group = [frag]
         elif abs(b - current_baseline) <= baseline_tolerance:
             current_group.append(frag)
-            current_baseline = sum(get_baseline(f) for f in current_group) / len(current_group)
+            baseline_sum += b
+            current_baseline = baseline_sum / len(current_group)
         else:
             if current_group:
                 baseline_groups[current_baseline] = current_group
-            current_baseline = b
+            current_baseline = baseline_sum = b
             current_group = [frag]
 
     if current_group:
@@ -2175,21 +2345,23 @@ def normalize_col_id_across_consecutive_lines(fragments, baseline_tol, left_tol=
     baseline_groups = []
     current_group = []
     current_baseline = None
+    baseline_sum = 0.0
 
     for f in sorted_frags:
         b = f["baseline"]
         if current_baseline is None:
             current_group = [f]
-            current_baseline = b
+            current_baseline = baseline_sum = b
         elif abs(b - current_baseline) <= baseline_tol:
             current_group.append(f)
             # Update to average baseline for better grouping
-            current_baseline = sum(frag["baseline"] for frag in current_group) / len(current_group)
+            baseline_sum += b
+            current_baseline = baseline_sum / len(current_group)
         else:
             if current_group:
                 baseline_groups.append(current_group)
             current_group = [f]
-            current_baseline = b
+            current_baseline = baseline_sum = b
 
     if current_group:
         baseline_groups.append(current_group)
@@ -2686,7 +2858,9 @@ def pdf_to_excel_with_columns(
                 if is_header_zone or is_footer_zone:
                     text_stripped = norm_txt.strip()
                     # Check for arabic numbers (1-9999) or roman numerals
-                    if re.match(r'^\d{1,4}$', text_stripped) or re.match(r'^[ivxlcdm]+$', text_stripped, re.IGNORECASE):
+                    if (_ARABIC_PAGE_NUMBER_RE.match(text_stripped)
+                            or text_stripped in _ROMAN_NUMERALS
+                            or _ROMAN_PAGE_NUMBER_RE.match(text_stripped)):
                         is_page_number = True
                         # Store in separate list for page ID extraction
                         page_number_fragments.append({